@@ -25,21 +25,27 @@ logger = logging.getLogger(__name__)
 async def create_bot():
     """Create and initialize the Telegram bot and assistant."""
     config = Config()
-    
+
+    # Optional proxy: when configured, Pyrogram uses its async
+    # python_socks transport for both sessions
+    proxy = config.get_proxy()
+
     # Initialize the bot and user client
     bot = Client(
         "music_bot",
         api_id=config.API_ID,
         api_hash=config.API_HASH,
-        bot_token=config.BOT_TOKEN
+        bot_token=config.BOT_TOKEN,
+        proxy=proxy
     )
-    
+
     # Initialize assistant for voice chats
     assistant = Client(
         "music_assistant",
         api_id=config.API_ID,
         api_hash=config.API_HASH,
-        session_string=config.SESSION_STRING
+        session_string=config.SESSION_STRING,
+        proxy=proxy
     )
     
     # Initialize PyTgCalls with the assistant
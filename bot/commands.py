@@ -4,6 +4,7 @@ import os
 import time
 import re
 from pyrogram import filters
+from pyrogram.enums import ChatType
 from pyrogram.types import Message, InlineKeyboardMarkup, InlineKeyboardButton
 
 from .helpers import (
@@ -1266,7 +1267,7 @@ Start by using /play command to play music in a voice chat!
         # Get user info for username mapping
         usernames = {}
         try:
-            if message.chat.type != "private":
+            if message.chat.type != ChatType.PRIVATE:
                 async for member in client.get_chat_members(chat_id):
                     if member.user and not member.user.is_bot:
                         usernames[member.user.id] = member.user.username or member.user.first_name
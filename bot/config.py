@@ -102,6 +102,14 @@ class Config:
     # Bot settings
     DURATION_LIMIT: int = int(os.getenv("DURATION_LIMIT", "180"))  # Max duration in minutes
     COMMAND_PREFIX: str = os.getenv("COMMAND_PREFIX", "/")
+
+    # Optional proxy for Telegram traffic; when set, Pyrogram routes
+    # through its async python_socks transport instead of a direct socket
+    PROXY_SCHEME: str = os.getenv("PROXY_SCHEME", "")  # e.g. "socks5"
+    PROXY_HOST: str = os.getenv("PROXY_HOST", "")
+    PROXY_PORT: int = int(os.getenv("PROXY_PORT", "0"))
+    PROXY_USERNAME: str = os.getenv("PROXY_USERNAME", "")
+    PROXY_PASSWORD: str = os.getenv("PROXY_PASSWORD", "")
     
     # Cache directory for downloaded songs
     CACHE_DIR: str = os.getenv("CACHE_DIR", "cache")
@@ -133,6 +141,20 @@ class Config:
         self.load_user_configs()
         self.load_chat_configs()
     
+    def get_proxy(self) -> Optional[Dict]:
+        """Build the Pyrogram proxy dict, or None when no proxy is configured."""
+        if not self.PROXY_SCHEME or not self.PROXY_HOST or not self.PROXY_PORT:
+            return None
+        proxy = {
+            "scheme": self.PROXY_SCHEME,
+            "hostname": self.PROXY_HOST,
+            "port": self.PROXY_PORT,
+        }
+        if self.PROXY_USERNAME:
+            proxy["username"] = self.PROXY_USERNAME
+            proxy["password"] = self.PROXY_PASSWORD
+        return proxy
+
     def get_user_config(self, user_id: int) -> UserConfig:
         """Get configuration for a specific user. Creates new config if not exists."""
         if user_id not in self.user_configs:
@@ -152,7 +174,15 @@ class Config:
         
         self.save_user_configs()
         return user_config
-    
+
+    def remove_user(self, user_id: int, save: bool = True) -> bool:
+        """Remove a user's configuration (e.g. after they blocked the bot)."""
+        if self.user_configs.pop(user_id, None) is None:
+            return False
+        if save:
+            self.save_user_configs()
+        return True
+
     def get_chat_config(self, chat_id: int) -> ChatConfig:
         """Get configuration for a specific chat. Creates new config if not exists."""
         if chat_id not in self.chat_configs:
@@ -597,6 +597,143 @@ class Database:
             
             return True
     
+    async def atomic_update_playlist(self, playlist_id: str, user_id: int,
+                                     set_fields: Dict[str, Any]) -> bool:
+        """Apply field updates to a playlist the user owns in one operation.
+
+        For pure field updates this replaces the read-then-write-everything
+        round-trip of update_playlist: ownership is part of the update filter
+        and only the changed fields travel to storage.
+        """
+        if self.connected:
+            result = await self.db.playlists.update_one(
+                {"id": playlist_id, "user_id": user_id},
+                {"$set": set_fields}
+            )
+            if result.matched_count == 0:
+                return False
+        else:
+            # Fallback to file storage: one read and one write
+            playlist = await self._get_from_file(f"playlist_{playlist_id}", None)
+            if not playlist or playlist.get("user_id") != user_id:
+                return False
+
+            playlist.update(set_fields)
+            await self._save_to_file(f"playlist_{playlist_id}", playlist)
+
+            # Mirror name/visibility changes into the user's summary list
+            if "name" in set_fields or "is_public" in set_fields:
+                user_playlists = await self._get_from_file(
+                    f"user_playlists_{user_id}", {"user_id": user_id, "playlists": []})
+                for summary in user_playlists["playlists"]:
+                    if summary["id"] == playlist_id:
+                        summary["name"] = set_fields.get("name", summary.get("name"))
+                        summary["is_public"] = set_fields.get("is_public", summary.get("is_public", False))
+                        break
+                await self._save_to_file(f"user_playlists_{user_id}", user_playlists)
+
+        self._invalidate_cache("playlist", playlist_id)
+        self._invalidate_cache("user_playlists", user_id)
+        if "is_public" in set_fields:
+            self._invalidate_cache("public_playlists", 0)  # Timestamp is 0
+        return True
+
+    async def append_track_to_playlist(self, playlist_id: str, user_id: int,
+                                       track: Dict[str, Any], max_tracks: int) -> str:
+        """Append a track to a playlist at the storage layer.
+
+        Avoids the full read-modify-write round-trip of update_playlist for
+        the common single-track add.
+
+        Returns one of "ok", "duplicate", "full", or "not_found" (the latter
+        also covers playlists owned by someone else).
+        """
+        track_id = track.get("id", "")
+
+        if self.connected:
+            # Atomic guarded push: only matches when the caller owns the
+            # playlist, the track isn't already present, and there's room.
+            # Requiring track_ids to exist keeps documents that predate the
+            # index off this fast path — $ne alone would match the missing
+            # field and leave a one-element index out of sync with tracks
+            query = {"id": playlist_id, "user_id": user_id}
+            if track_id:
+                query["track_ids"] = {"$exists": True, "$ne": track_id}
+            query[f"tracks.{max_tracks - 1}"] = {"$exists": False}
+            update = {
+                "$push": {"tracks": track, "track_ids": track_id},
+                "$set": {"updated_at": int(time.time())}
+            }
+
+            result = await self.db.playlists.update_one(query, update)
+
+            if result.modified_count > 0:
+                self._invalidate_cache("playlist", playlist_id)
+                self._invalidate_cache("user_playlists", user_id)
+                return "ok"
+
+            # Distinguish why the guarded update didn't match
+            playlist = await self.get_playlist(playlist_id)
+            if not playlist or playlist.get("user_id") != user_id:
+                return "not_found"
+
+            if "track_ids" not in playlist:
+                # Playlist predates the track_ids index: backfill it from
+                # tracks (as the file branch does) and append in the same
+                # write, guarded so a concurrent backfill can't run twice
+                tracks = playlist.get("tracks", [])
+                track_ids = [t.get("id") for t in tracks]
+                if track_id and track_id in set(track_ids):
+                    return "duplicate"
+                if len(tracks) >= max_tracks:
+                    return "full"
+
+                result = await self.db.playlists.update_one(
+                    {"id": playlist_id, "user_id": user_id,
+                     "track_ids": {"$exists": False}},
+                    {"$push": {"tracks": track},
+                     "$set": {"track_ids": track_ids + [track_id],
+                              "updated_at": int(time.time())}}
+                )
+                if result.modified_count == 0:
+                    # Lost a race with another writer that backfilled the
+                    # index first; the fast path is safe to retry now
+                    result = await self.db.playlists.update_one(query, update)
+                if result.modified_count > 0:
+                    self._invalidate_cache("playlist", playlist_id)
+                    self._invalidate_cache("user_playlists", user_id)
+                    return "ok"
+                playlist = await self.get_playlist(playlist_id) or {}
+
+            if track_id and track_id in playlist.get("track_ids", []):
+                return "duplicate"
+            return "full"
+        else:
+            # Fallback to file storage: one read and one write
+            playlist = await self._get_from_file(f"playlist_{playlist_id}", None)
+            if not playlist or playlist.get("user_id") != user_id:
+                return "not_found"
+
+            tracks = playlist.setdefault("tracks", [])
+            track_ids = playlist.get("track_ids")
+            if track_ids is None:
+                track_ids = [t.get("id") for t in tracks]
+                playlist["track_ids"] = track_ids
+
+            if track_id and track_id in set(track_ids):
+                return "duplicate"
+            if len(tracks) >= max_tracks:
+                return "full"
+
+            tracks.append(track)
+            track_ids.append(track_id)
+            playlist["updated_at"] = int(time.time())
+
+            await self._save_to_file(f"playlist_{playlist_id}", playlist)
+            self._invalidate_cache("playlist", playlist_id)
+            self._invalidate_cache("user_playlists", user_id)
+            return "ok"
+
     async def delete_playlist(self, playlist_id: str) -> bool:
         """Delete a playlist."""
         # Get playlist to get user_id for cache invalidation
@@ -681,6 +818,18 @@ class Database:
             
             return self._set_cache("user_playlists", user_id, result)
     
+    async def count_user_playlists(self, user_id: int) -> int:
+        """Count a user's playlists without loading their full contents."""
+        if self.connected:
+            return await self.db.playlists.count_documents({"user_id": user_id})
+
+        # The summary file already tracks one entry per playlist, so the
+        # count never needs the per-playlist documents
+        user_playlists = await self._get_from_file(f"user_playlists_{user_id}", None)
+        if not user_playlists:
+            return 0
+        return len(user_playlists.get("playlists", []))
+
     async def get_public_playlists(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get public playlists."""
         # Try cache first for fast response
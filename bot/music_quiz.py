@@ -1,18 +1,46 @@
 """Music quiz game for the Telegram music bot."""
 import logging
 import asyncio
+import heapq
 import random
+import sys
 import time
 from typing import Dict, List, Any, Optional, Set, Tuple
 
+import aiohttp
+
+from pyrogram.types import InlineKeyboardMarkup, InlineKeyboardButton
+
 from bot.spotify import SpotifyClient
 from bot.database import Database
 
 logger = logging.getLogger(__name__)
 
+# The answer keyboard is identical for every question (only the quiz state
+# behind the callback_data changes), so build it once at import time
+_STATIC_QUIZ_MARKUP = InlineKeyboardMarkup(
+    [[InlineKeyboardButton(label, callback_data=f"quiz_answer_{i}")]
+     for i, label in enumerate("ABCD")]
+    + [[InlineKeyboardButton("🛑 End Quiz", callback_data="quiz_end")]]
+)
+
+# Question-type mix per difficulty, frozen as shared tuples so
+# _get_question_types never rebuilds a list
+_QUESTION_TYPES: Dict[str, Tuple[str, ...]] = {
+    # Only basic question types for easy
+    "easy": ("guess_song", "guess_artist"),
+    # More variety in medium
+    "medium": ("guess_song", "guess_artist", "guess_song", "finish_lyrics"),
+    # Most challenging mix for hard
+    "hard": ("guess_song", "guess_artist", "finish_lyrics", "finish_lyrics"),
+}
+
 class QuizQuestion:
     """Represents a single music quiz question."""
-    
+
+    __slots__ = ("track_info", "options", "correct_index", "preview_url",
+                 "answered_by", "start_time_ns")
+
     def __init__(self, track_info: Dict[str, Any], options: List[str], correct_index: int):
         """
         Initialize a quiz question.
@@ -27,7 +55,9 @@ class QuizQuestion:
         self.correct_index = correct_index
         self.preview_url = track_info.get("preview_url")
         self.answered_by: Dict[int, int] = {}  # user_id -> selected_option_index
-        self.start_time = time.time()
+        # Monotonic nanoseconds: immune to wall-clock jumps and avoids float
+        # math in the per-answer scoring path
+        self.start_time_ns = time.monotonic_ns()
     
     def add_answer(self, user_id: int, option_index: int) -> bool:
         """
@@ -77,10 +107,11 @@ class QuizQuestion:
         
         # Calculate score based on speed (max 100 points per question)
         # Score decreases over time, minimum 50 points for correct answer
-        elapsed_time = time.time() - self.start_time
-        time_factor = max(0, 1 - (elapsed_time / 15))  # 15 seconds to answer for max points
-        
-        return int(50 + (50 * time_factor))
+        elapsed_ns = time.monotonic_ns() - self.start_time_ns
+        # 15 seconds to answer for max points; pure integer arithmetic
+        bonus = max(0, 50 - (elapsed_ns * 50) // (15 * 10**9))
+
+        return 50 + bonus
     
     def get_correct_answer(self) -> str:
         """
@@ -126,6 +157,26 @@ class MusicQuiz:
         self.spotify = spotify
         self.database = database
         self.active_quizzes: Dict[int, 'QuizSession'] = {}  # chat_id -> quiz session
+
+        # Prewarm the Spotify session/token so the first create_quiz doesn't
+        # pay the TLS + OAuth round trip on the quiz-start path
+        try:
+            self._prewarm_task = asyncio.create_task(self.spotify.ensure_token())
+        except RuntimeError:
+            # No running event loop (e.g. constructed synchronously in tests);
+            # the token will be fetched lazily on first use instead
+            self._prewarm_task = None
+
+        # TTL cache of track pools keyed by (genre, count) so quizzes started
+        # close together reuse one Spotify fetch instead of hitting the API
+        self._track_cache: Dict[Tuple[Optional[str], int], Tuple[float, List[Dict[str, Any]]]] = {}
+        self._track_cache_ttl = 300  # seconds
+
+        # One timer wheel shared by all sessions: a heap of
+        # (deadline, chat_id, question_index) entries drained by a single
+        # task, instead of one sleeping task per active question
+        self._deadlines: List[Tuple[float, int, int]] = []
+        self._timer_task: Optional[asyncio.Task] = None
     
     async def create_quiz(self, chat_id: int, creator_id: int, 
                         num_questions: int = 5, 
@@ -188,7 +239,77 @@ class MusicQuiz:
             self.active_quizzes[chat_id].end()
             del self.active_quizzes[chat_id]
     
-    async def get_random_tracks(self, 
+    def schedule_question_timeout(self, session: 'QuizSession'):
+        """
+        Register a timeout deadline for the session's current question.
+
+        Args:
+            session: The QuizSession whose current question should time out.
+        """
+        deadline = time.monotonic() + session.question_time_limit
+        heapq.heappush(self._deadlines, (deadline, session.chat_id, session.current_question_index))
+
+        if self._timer_task is None or self._timer_task.done():
+            self._timer_task = asyncio.create_task(self._tick())
+
+    async def _tick(self):
+        """Drain the shared deadline heap, firing timeouts as they come due."""
+        try:
+            while self._deadlines:
+                deadline, chat_id, question_index = self._deadlines[0]
+                delay = deadline - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                    continue
+
+                heapq.heappop(self._deadlines)
+
+                session = self.active_quizzes.get(chat_id)
+                if not session:
+                    continue
+
+                if not session.is_active():
+                    # Evict stale sessions so they don't linger after end()
+                    del self.active_quizzes[chat_id]
+                    continue
+
+                if session.current_question_index != question_index:
+                    # The quiz already moved on; this deadline is obsolete
+                    continue
+
+                # Time's up for this question - trigger next question
+                # This would normally call back to the bot's command handler
+                # to display results and move to the next question
+                logger.info(f"Time's up for question {question_index + 1} in chat {chat_id}")
+        except Exception as e:
+            logger.error(f"Error in quiz timer: {e}", exc_info=True)
+
+    async def _filter_reachable_previews(self, tracks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Drop tracks whose preview URL is dead, checking them concurrently.
+
+        Args:
+            tracks: Track dicts that all carry a preview_url.
+
+        Returns:
+            The tracks whose preview URLs answered a HEAD request with 200.
+        """
+        session = self.spotify.session
+        if not session or not tracks:
+            return tracks
+
+        async def _head_ok(url: str) -> bool:
+            try:
+                async with session.head(url, timeout=aiohttp.ClientTimeout(total=2),
+                                        allow_redirects=True) as response:
+                    return response.status == 200
+            except Exception:
+                return False
+
+        results = await asyncio.gather(*(_head_ok(t["preview_url"]) for t in tracks))
+        return [t for t, ok in zip(tracks, results) if ok]
+
+    async def get_random_tracks(self,
                               count: int = 10, 
                               genre: Optional[str] = None) -> List[Dict[str, Any]]:
         """
@@ -202,24 +323,48 @@ class MusicQuiz:
             List of track info dictionaries.
         """
         try:
+            # Serve from the TTL cache when a recent pool exists for this
+            # (genre, count); sample so concurrent quizzes still differ
+            cache_key = (genre, count)
+            cached = self._track_cache.get(cache_key)
+            if cached and time.time() - cached[0] < self._track_cache_ttl:
+                pool = cached[1]
+                if len(pool) >= count:
+                    return random.sample(pool, count)
+
             if genre:
                 # Get tracks by genre
                 tracks = await self.spotify.get_recommendations_by_genres(genre, limit=count)
             else:
                 # Get trending tracks
                 tracks = await self.spotify.get_trending_tracks(limit=count)
-            
-            # Filter tracks with preview URLs (needed for audio questions)
+
+            # Filter tracks with preview URLs (needed for audio questions),
+            # then drop any whose preview is no longer reachable so the quiz
+            # doesn't stall on a 404 mid-game; the HEADs run in parallel
             tracks_with_preview = [t for t in tracks if t.get("preview_url")]
-            
+            tracks_with_preview = await self._filter_reachable_previews(tracks_with_preview)
+
             if len(tracks_with_preview) < count:
                 # If we don't have enough tracks with previews, supplement with more tracks
                 more_tracks = await self.spotify.get_trending_tracks(limit=count*2)
                 more_with_preview = [t for t in more_tracks if t.get("preview_url") and t not in tracks_with_preview]
+                more_with_preview = await self._filter_reachable_previews(more_with_preview)
                 tracks_with_preview.extend(more_with_preview[:count-len(tracks_with_preview)])
-            
+
+            # Intern the names and artists so repeated strings across
+            # questions and sessions share one object and compare by identity
+            for track in tracks_with_preview:
+                if isinstance(track.get("name"), str):
+                    track["name"] = sys.intern(track["name"])
+                if isinstance(track.get("artists"), str):
+                    track["artists"] = sys.intern(track["artists"])
+
+            # Cache the full pool for subsequent quizzes
+            self._track_cache[cache_key] = (time.time(), tracks_with_preview)
+
             return tracks_with_preview[:count]
-        
+
         except Exception as e:
             logger.error(f"Error getting random tracks for quiz: {e}", exc_info=True)
             return []
@@ -227,7 +372,11 @@ class MusicQuiz:
 
 class QuizSession:
     """A session of the music quiz for a specific chat."""
-    
+
+    __slots__ = ("quiz_manager", "chat_id", "creator_id", "num_questions",
+                 "genre", "difficulty", "questions", "current_question_index",
+                 "active", "scores", "start_time", "question_time_limit")
+
     def __init__(self, quiz_manager: MusicQuiz, 
                 chat_id: int, 
                 creator_id: int,
@@ -258,7 +407,6 @@ class QuizSession:
         self.scores: Dict[int, int] = {}  # user_id -> total score
         self.start_time = time.time()
         self.question_time_limit = 30  # seconds
-        self.question_timer = None
     
     async def generate_questions(self) -> bool:
         """
@@ -277,36 +425,42 @@ class QuizSession:
             logger.error(f"Not enough tracks available for quiz. Got {len(tracks)}, need {self.num_questions}")
             return False
         
-        # Shuffle tracks
-        random.shuffle(tracks)
-        
+        # Draw a uniform random subset instead of shuffling the whole pool;
+        # at most 4 tracks are consumed per question (1 answer + 3 wrong)
+        tracks = random.sample(tracks, k=min(len(tracks), self.num_questions * 4))
+
+
         # Create different types of questions
         question_types = self._get_question_types()
         self.questions = []
-        
+
+        # Walk the track list with a cursor and slices instead of repeated
+        # pop(0) calls, which shift the whole list on every question
+        pos = 0
+
         for i in range(self.num_questions):
-            if not tracks:
+            if pos >= len(tracks):
                 break
-                
+
             # Select a question type
             question_type = random.choice(question_types)
-            
+
             # Get a track for this question
-            main_track = tracks.pop(0)
-            
+            main_track = tracks[pos]
+            pos += 1
+
             if question_type == "guess_song":
                 # Create a "Guess the song" question
+                wrong_tracks = tracks[pos:pos + 3]
+                pos += len(wrong_tracks)
+
                 options = [main_track["name"]]
-                
-                # Add wrong options
-                for _ in range(3):
-                    if tracks:
-                        wrong_track = tracks.pop(0)
-                        options.append(wrong_track["name"])
-                    else:
-                        # Generate a fake option if we run out of tracks
-                        options.append(f"Wrong Song {i}")
-                
+                options.extend(t["name"] for t in wrong_tracks)
+
+                # Generate fake options if we run out of tracks
+                while len(options) < 4:
+                    options.append(f"Wrong Song {i}")
+
                 # Shuffle options
                 correct_index = 0
                 random.shuffle(options)
@@ -314,25 +468,28 @@ class QuizSession:
                     if option == main_track["name"]:
                         correct_index = j
                         break
-                
+
                 self.questions.append(QuizQuestion(main_track, options, correct_index))
-                
+
             elif question_type == "guess_artist":
                 # Create a "Guess the artist" question
                 artist = main_track.get("artists", "Unknown Artist")
+                wrong_tracks = tracks[pos:pos + 3]
+                pos += len(wrong_tracks)
+
                 options = [artist]
-                
-                # Add wrong options
-                for _ in range(3):
-                    if tracks:
-                        wrong_track = tracks.pop(0)
-                        wrong_artist = wrong_track.get("artists", "Unknown Artist")
-                        if wrong_artist not in options:
-                            options.append(wrong_artist)
-                    else:
-                        # Generate a fake option if we run out of tracks
-                        options.append(f"Wrong Artist {i}")
-                
+                for wrong_track in wrong_tracks:
+                    wrong_artist = wrong_track.get("artists", "Unknown Artist")
+                    if wrong_artist not in options:
+                        options.append(wrong_artist)
+
+                # Pad to exactly four options: besides running out of
+                # tracks, a duplicate wrong artist may have been skipped
+                # above, and the static A-D answer keyboard assumes every
+                # question really has four entries
+                while len(options) < 4:
+                    options.append(f"Wrong Artist {len(options)}")
+
                 # Shuffle options
                 correct_index = 0
                 random.shuffle(options)
@@ -340,7 +497,7 @@ class QuizSession:
                     if option == artist:
                         correct_index = j
                         break
-                
+
                 self.questions.append(QuizQuestion(main_track, options, correct_index))
             
             elif question_type == "finish_lyrics":
@@ -362,22 +519,14 @@ class QuizSession:
         
         return len(self.questions) == self.num_questions
     
-    def _get_question_types(self) -> List[str]:
+    def _get_question_types(self) -> Tuple[str, ...]:
         """
         Get question types based on difficulty.
-        
+
         Returns:
-            List of question type identifiers.
-        """
-        if self.difficulty == "easy":
-            # Only basic question types for easy
-            return ["guess_song", "guess_artist"]
-        elif self.difficulty == "medium":
-            # More variety in medium
-            return ["guess_song", "guess_artist", "guess_song", "finish_lyrics"]
-        else:  # hard
-            # Most challenging mix for hard
-            return ["guess_song", "guess_artist", "finish_lyrics", "finish_lyrics"]
+            Tuple of question type identifiers.
+        """
+        return _QUESTION_TYPES.get(self.difficulty, _QUESTION_TYPES["hard"])
     
     def is_active(self) -> bool:
         """
@@ -390,10 +539,9 @@ class QuizSession:
     
     def end(self):
         """End the quiz session."""
+        # Any pending deadline for this session becomes a no-op in the
+        # shared timer wheel once the session is inactive
         self.active = False
-        if self.question_timer:
-            self.question_timer.cancel()
-            self.question_timer = None
     
     def get_current_question(self) -> Optional[QuizQuestion]:
         """
@@ -416,42 +564,20 @@ class QuizSession:
         """
         if not self.is_active():
             return None
-        
-        # Cancel any existing timer
-        if self.question_timer:
-            self.question_timer.cancel()
-            self.question_timer = None
-        
+
         # Increment index
         self.current_question_index += 1
-        
+
         # Check if we've reached the end
         if self.current_question_index >= len(self.questions):
             return None
-        
-        # Start timer for this question
-        self.question_timer = asyncio.create_task(self._question_timer())
-        
+
+        # Register this question's deadline with the shared timer wheel;
+        # moving to the next question makes any older deadline obsolete
+        self.quiz_manager.schedule_question_timeout(self)
+
         return self.get_current_question()
-    
-    async def _question_timer(self):
-        """Timer task for the current question."""
-        try:
-            await asyncio.sleep(self.question_time_limit)
-            
-            # Time's up for this question - trigger next question
-            # This would normally call back to the bot's command handler
-            # to display results and move to the next question
-            logger.info(f"Time's up for question {self.current_question_index + 1} in chat {self.chat_id}")
-            
-            # Note: In a real implementation, you'd trigger a callback here
-            # to the bot's command handler to show the time's up message
-        except asyncio.CancelledError:
-            # Timer was cancelled, this is fine
-            pass
-        except Exception as e:
-            logger.error(f"Error in question timer: {e}", exc_info=True)
-    
+
     def add_answer(self, user_id: int, option_index: int) -> Tuple[bool, bool, int]:
         """
         Add a user's answer for the current question.
@@ -502,15 +628,16 @@ class QuizSession:
         """
         duration = time.time() - self.start_time
         
-        # Calculate stats
+        # Calculate stats; bind the per-question attributes to locals so the
+        # inner loop avoids repeated attribute lookups and method calls
         total_answers = 0
         correct_answers = 0
-        
+
         for question in self.questions:
-            for user_id, option_index in question.answered_by.items():
-                total_answers += 1
-                if question.is_correct(option_index):
-                    correct_answers += 1
+            answers = question.answered_by
+            correct_index = question.correct_index
+            total_answers += len(answers)
+            correct_answers += sum(1 for selected in answers.values() if selected == correct_index)
         
         # Get unique participants count
         all_user_ids = set()
@@ -541,34 +668,17 @@ class QuizSession:
             The sent message, or None if there was an error.
         """
         from bot.ui import send_quiz_question
-        
+
         question = self.get_current_question()
         if not question:
             return None
-        
+
         # Determine question type
         question_types = self._get_question_types()
         question_index = min(self.current_question_index, len(question_types) - 1)
         question_type = question_types[question_index % len(question_types)]
-        
-        # Create inline keyboard for answers
-        from pyrogram.types import InlineKeyboardMarkup, InlineKeyboardButton
-        
-        buttons = []
-        labels = ['A', 'B', 'C', 'D']
-        for i, _ in enumerate(question.options[:4]):
-            buttons.append([
-                InlineKeyboardButton(f"{labels[i]}", callback_data=f"quiz_answer_{i}")
-            ])
-        
-        # Add end quiz button
-        buttons.append([
-            InlineKeyboardButton("🛑 End Quiz", callback_data="quiz_end")
-        ])
-        
-        reply_markup = InlineKeyboardMarkup(buttons)
-        
-        # Use enhanced UI to send question
+
+        # Use enhanced UI to send question with the precomputed answer keyboard
         return await send_quiz_question(
             client=client,
             message=await client.send_message(chat_id, "Loading quiz question..."),
@@ -577,7 +687,7 @@ class QuizSession:
             track_info=question.track_info,
             question_type=question_type,
             options=question.options,
-            reply_markup=reply_markup
+            reply_markup=_STATIC_QUIZ_MARKUP
         )
     
     async def send_results(self, client, chat_id, usernames: Optional[Dict[int, str]] = None):
@@ -603,8 +713,6 @@ class QuizSession:
             formatted_leaderboard.append((username, score))
         
         # Create a "play again" button
-        from pyrogram.types import InlineKeyboardMarkup, InlineKeyboardButton
-        
         reply_markup = InlineKeyboardMarkup([[
             InlineKeyboardButton("🎮 Play Again", callback_data="quiz_new")
         ]])
@@ -35,14 +35,18 @@ class PlaylistManager:
         Returns:
             The created playlist object.
         """
-        # Check if user has reached the playlist limit
-        user_playlists = await self.get_user_playlists(user_id)
-        if len(user_playlists) >= self.max_playlists_per_user:
+        # Check if user has reached the playlist limit; a count query avoids
+        # loading every playlist's full track list just to measure length
+        if await self.database.count_user_playlists(user_id) >= self.max_playlists_per_user:
             raise ValueError(f"You can only create up to {self.max_playlists_per_user} playlists")
         
         # Create a unique ID for the playlist
         playlist_id = str(uuid.uuid4())
-        
+
+        # One integer-second timestamp per call; time_ns avoids the float
+        # round-trip of int(time.time())
+        now = time.time_ns() // 1_000_000_000
+
         # Create the playlist object
         playlist = {
             "id": playlist_id,
@@ -50,8 +54,9 @@ class PlaylistManager:
             "name": name,
             "description": description or "",
             "tracks": [],
-            "created_at": int(time.time()),
-            "updated_at": int(time.time()),
+            "track_ids": [],  # index of track IDs for O(1) duplicate checks
+            "created_at": now,
+            "updated_at": now,
             "is_public": False
         }
         
@@ -72,48 +77,55 @@ class PlaylistManager:
         Returns:
             True if successful, False otherwise.
         """
-        # Get the playlist
-        playlist = await self.database.get_playlist(playlist_id)
-        if not playlist:
-            logger.error(f"Playlist not found: {playlist_id}")
-            return False
-        
-        # Check if user owns the playlist
-        if playlist.get("user_id") != user_id:
-            logger.error(f"User {user_id} does not own playlist {playlist_id}")
-            return False
-        
-        # Check if playlist is full
-        if len(playlist.get("tracks", [])) >= self.max_tracks_per_playlist:
-            logger.error(f"Playlist {playlist_id} is full")
-            return False
-        
-        # Check if track already exists in playlist
-        track_id = track_info.get("id")
-        if track_id:
-            for existing_track in playlist.get("tracks", []):
-                if existing_track.get("id") == track_id:
-                    logger.info(f"Track {track_id} already in playlist {playlist_id}")
-                    return True
-        
-        # Add track to playlist
         track_to_add = {
             "id": track_info.get("id", ""),
             "name": track_info.get("name", "Unknown"),
             "artists": track_info.get("artists", "Unknown"),
             "album": track_info.get("album", "Unknown"),
             "duration_ms": track_info.get("duration_ms", 0),
-            "added_at": int(time.time())
+            "added_at": time.time_ns() // 1_000_000_000
         }
-        
-        playlist["tracks"].append(track_to_add)
-        playlist["updated_at"] = int(time.time())
-        
-        # Update the playlist in the database
-        success = await self.database.update_playlist(playlist_id, playlist)
-        
-        return success
+
+        # The database appends in place, so the ownership, duplicate, and
+        # capacity checks cost a single round-trip instead of a full
+        # read-modify-write of the playlist document
+        status = await self.database.append_track_to_playlist(
+            playlist_id, user_id, track_to_add, self.max_tracks_per_playlist
+        )
+
+        if status == "ok":
+            return True
+        if status == "duplicate":
+            logger.info("Track %s already in playlist %s", track_to_add['id'], playlist_id)
+            return True
+        if status == "full":
+            logger.error("Playlist %s is full", playlist_id)
+        else:
+            logger.error("Playlist %s not found or not owned by user %s", playlist_id, user_id)
+        return False
     
+    async def _load_owned_playlist(self, user_id: int, playlist_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a playlist and verify the user owns it.
+
+        Args:
+            user_id: The Telegram user ID.
+            playlist_id: The playlist ID.
+
+        Returns:
+            The playlist object, or None if missing or owned by someone else.
+        """
+        playlist = await self.database.get_playlist(playlist_id)
+        if not playlist:
+            logger.error("Playlist not found: %s", playlist_id)
+            return None
+
+        if playlist.get("user_id") != user_id:
+            logger.error("User %s does not own playlist %s", user_id, playlist_id)
+            return None
+
+        return playlist
+
     async def remove_track_from_playlist(self, user_id: int, playlist_id: str, track_id: str) -> bool:
         """
         Remove a track from a playlist.
@@ -126,32 +138,28 @@ class PlaylistManager:
         Returns:
             True if successful, False otherwise.
         """
-        # Get the playlist
-        playlist = await self.database.get_playlist(playlist_id)
-        if not playlist:
-            logger.error(f"Playlist not found: {playlist_id}")
+        # Get the playlist, verifying ownership
+        playlist = await self._load_owned_playlist(user_id, playlist_id)
+        if playlist is None:
             return False
         
-        # Check if user owns the playlist
-        if playlist.get("user_id") != user_id:
-            logger.error(f"User {user_id} does not own playlist {playlist_id}")
+        # O(1) early exit via the ID index when the track isn't present
+        track_ids = playlist.get("track_ids")
+        if track_ids is not None and track_id not in set(track_ids):
+            logger.error("Track %s not found in playlist %s", track_id, playlist_id)
             return False
-        
-        # Find and remove the track
+
+        # Rebuild the list in a single pass instead of scanning and shifting
         tracks = playlist.get("tracks", [])
-        found = False
-        for i, track in enumerate(tracks):
-            if track.get("id") == track_id:
-                found = True
-                tracks.pop(i)
-                break
-        
-        if not found:
-            logger.error(f"Track {track_id} not found in playlist {playlist_id}")
+        new_tracks = [t for t in tracks if t.get("id") != track_id]
+        if len(new_tracks) == len(tracks):
+            logger.error("Track %s not found in playlist %s", track_id, playlist_id)
             return False
-        
-        playlist["tracks"] = tracks
-        playlist["updated_at"] = int(time.time())
+
+        playlist["tracks"] = new_tracks
+        # Keep the ID index in sync with the track list
+        playlist["track_ids"] = [t.get("id") for t in new_tracks]
+        playlist["updated_at"] = time.time_ns() // 1_000_000_000
         
         # Update the playlist in the database
         success = await self.database.update_playlist(playlist_id, playlist)
@@ -193,15 +201,9 @@ class PlaylistManager:
         Returns:
             True if successful, False otherwise.
         """
-        # Get the playlist
-        playlist = await self.database.get_playlist(playlist_id)
-        if not playlist:
-            logger.error(f"Playlist not found: {playlist_id}")
-            return False
-        
-        # Check if user owns the playlist
-        if playlist.get("user_id") != user_id:
-            logger.error(f"User {user_id} does not own playlist {playlist_id}")
+        # Get the playlist, verifying ownership
+        playlist = await self._load_owned_playlist(user_id, playlist_id)
+        if playlist is None:
             return False
         
         # Delete the playlist from the database
@@ -224,33 +226,21 @@ class PlaylistManager:
         Returns:
             True if successful, False otherwise.
         """
-        # Get the playlist
-        playlist = await self.database.get_playlist(playlist_id)
-        if not playlist:
-            logger.error(f"Playlist not found: {playlist_id}")
-            return False
-        
-        # Check if user owns the playlist
-        if playlist.get("user_id") != user_id:
-            logger.error(f"User {user_id} does not own playlist {playlist_id}")
-            return False
-        
-        # Update the fields
+        # Send only the changed fields; ownership is enforced inside the
+        # atomic update, so no read round-trip is needed
+        set_fields: Dict[str, Any] = {}
         if name is not None:
-            playlist["name"] = name
-        
+            set_fields["name"] = name
+
         if description is not None:
-            playlist["description"] = description
-        
+            set_fields["description"] = description
+
         if is_public is not None:
-            playlist["is_public"] = is_public
-        
-        playlist["updated_at"] = int(time.time())
-        
-        # Update the playlist in the database
-        success = await self.database.update_playlist(playlist_id, playlist)
-        
-        return success
+            set_fields["is_public"] = is_public
+
+        set_fields["updated_at"] = time.time_ns() // 1_000_000_000
+
+        return await self.database.atomic_update_playlist(playlist_id, user_id, set_fields)
     
     async def get_public_playlists(self, limit: int = 10) -> List[Dict[str, Any]]:
         """
@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import weakref
 from collections import defaultdict, deque
 import time
 
@@ -9,15 +10,27 @@ class QueueManager:
     """Manager for song queues across different chats."""
     
     def __init__(self):
-        self.queues = defaultdict(deque)  # chat_id -> queue of tracks
-        self.history = defaultdict(list)  # chat_id -> list of played tracks
-        self.locks = defaultdict(asyncio.Lock)  # chat_id -> lock
         self.max_history_size = 50
         self.max_queue_size = 100
-    
+        self.queues = defaultdict(deque)  # chat_id -> queue of tracks
+        # maxlen makes eviction automatic and O(1) instead of pop(0) shifts
+        self.history = defaultdict(lambda: deque(maxlen=self.max_history_size))  # chat_id -> played tracks
+        # Weak values: a chat's lock is GC'd as soon as nobody holds it,
+        # instead of accumulating one per chat the bot has ever served
+        self.locks = weakref.WeakValueDictionary()  # chat_id -> lock
+
+    def _lock(self, chat_id):
+        """Get or lazily create the queue lock for a chat."""
+        lock = self.locks.get(chat_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            self.locks[chat_id] = lock
+        return lock
+
     async def add_to_queue(self, chat_id, track, user_id=None):
         """Add a track to the queue for a specific chat."""
-        async with self.locks[chat_id]:
+        # The local reference keeps the weakly-held lock alive while in use
+        async with self._lock(chat_id):
             # Check if queue is full
             if len(self.queues[chat_id]) >= self.max_queue_size:
                 return False, f"Queue limit of {self.max_queue_size} reached"
@@ -33,83 +46,99 @@ class QueueManager:
             self.queues[chat_id].append(track_with_meta)
             queue_position = len(self.queues[chat_id])
             
-            logger.info(f"Added {track['name']} to queue at position {queue_position} in {chat_id}")
+            logger.info("Added %s to queue at position %d in %s", track['name'], queue_position, chat_id)
             return True, f"Added to queue at position {queue_position}: {track['name']} by {track['artists']}"
     
     def get_next_track(self, chat_id):
         """Get the next track from the queue for a specific chat."""
-        # Check if queue is empty
-        if not self.queues[chat_id]:
+        # Check if queue is empty; .get avoids materializing one for
+        # chats that never queued anything
+        queue = self.queues.get(chat_id)
+        if not queue:
             return None
         
         # Get the next track
-        track = self.queues[chat_id].popleft()
+        track = queue.popleft()
         
         # Add to history
         self.add_to_history(chat_id, track)
         
-        logger.info(f"Getting next track from queue in {chat_id}: {track['name']}")
+        logger.info("Getting next track from queue in %s: %s", chat_id, track['name'])
         return track
     
     def peek_next_track(self, chat_id):
         """Peek at the next track without removing it from the queue."""
-        if not self.queues[chat_id]:
+        queue = self.queues.get(chat_id)
+        if not queue:
             return None
-        return self.queues[chat_id][0]
+        return queue[0]
     
     def add_to_history(self, chat_id, track):
-        """Add a track to the history."""
+        """Add a track to the history; the deque's maxlen bounds its size."""
         self.history[chat_id].append(track)
-        
-        # Limit history size
-        if len(self.history[chat_id]) > self.max_history_size:
-            self.history[chat_id].pop(0)
     
     def get_queue(self, chat_id):
         """Get the current queue for a specific chat."""
-        return list(self.queues[chat_id])
+        return list(self.queues.get(chat_id, ()))
     
     def get_history(self, chat_id):
         """Get the history for a specific chat."""
-        return self.history[chat_id]
+        return list(self.history.get(chat_id, ()))
     
     def clear_queue(self, chat_id):
         """Clear the queue for a specific chat."""
-        self.queues[chat_id].clear()
-        logger.info(f"Cleared queue for {chat_id}")
+        queue = self.queues.get(chat_id)
+        if queue:
+            queue.clear()
+        logger.info("Cleared queue for %s", chat_id)
     
     def remove_from_queue(self, chat_id, index):
         """Remove a track from the queue by index."""
-        if not 0 <= index < len(self.queues[chat_id]):
+        queue = self.queues.get(chat_id)
+        if queue is None or not 0 <= index < len(queue):
             return False, "Invalid track index"
-        
-        track_list = list(self.queues[chat_id])
-        removed_track = track_list.pop(index)
-        self.queues[chat_id] = deque(track_list)
-        
-        logger.info(f"Removed track {removed_track['name']} from queue in {chat_id}")
+
+        # Rotate the target to the front, pop it, and rotate back - in-place
+        # on the same deque instead of rebuilding it through a list
+        queue.rotate(-index)
+        removed_track = queue.popleft()
+        queue.rotate(index)
+
+        logger.info("Removed track %s from queue in %s", removed_track['name'], chat_id)
         return True, f"Removed from queue: {removed_track['name']}"
-    
+
     def move_track(self, chat_id, old_index, new_index):
         """Move a track in the queue from one position to another."""
-        if not 0 <= old_index < len(self.queues[chat_id]):
+        queue = self.queues.get(chat_id)
+        if queue is None or not 0 <= old_index < len(queue):
             return False, "Invalid source track index"
-        
-        if not 0 <= new_index < len(self.queues[chat_id]):
+
+        if not 0 <= new_index < len(queue):
             return False, "Invalid destination track index"
-        
-        track_list = list(self.queues[chat_id])
-        track = track_list.pop(old_index)
-        track_list.insert(new_index, track)
-        self.queues[chat_id] = deque(track_list)
-        
-        logger.info(f"Moved track {track['name']} from position {old_index} to {new_index} in {chat_id}")
+
+        # Pop the track at old_index and re-insert at new_index purely via
+        # rotations, keeping the same deque object throughout
+        queue.rotate(-old_index)
+        track = queue.popleft()
+        queue.rotate(old_index - new_index)
+        queue.appendleft(track)
+        queue.rotate(new_index)
+
+        logger.info("Moved track %s from position %d to %d in %s", track['name'], old_index, new_index, chat_id)
         return True, f"Moved track from position {old_index + 1} to {new_index + 1}"
     
     def has_tracks(self, chat_id):
         """Check if there are any tracks in the queue for a specific chat."""
-        return bool(self.queues[chat_id])
+        return bool(self.queues.get(chat_id))
     
     def queue_length(self, chat_id):
         """Get the length of the queue for a specific chat."""
-        return len(self.queues[chat_id])
+        queue = self.queues.get(chat_id)
+        return len(queue) if queue else 0
+    
+    def cleanup_chat(self, chat_id):
+        """Release the queue, history, and lock held for a chat."""
+        self.queues.pop(chat_id, None)
+        self.history.pop(chat_id, None)
+        self.locks.pop(chat_id, None)
+        logger.info("Released queue state for %s", chat_id)
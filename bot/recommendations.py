@@ -1,21 +1,52 @@
 """Module for handling music recommendations."""
+import copy
 import logging
 import asyncio
 import random
-from typing import List, Dict, Any, Optional
+import time
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple
 
 from bot.database import Database
 from bot.spotify import SpotifyClient
 
 logger = logging.getLogger(__name__)
 
+# Shared fallbacks so _format_track never allocates them per call
+_DEFAULT_ARTISTS = [{"name": "Unknown"}]
+_EMPTY: Dict[str, Any] = {}
+
+
+def _format_track(track: Dict[str, Any], reason: str) -> Dict[str, Any]:
+    """Build the recommendation dict served to callers from a Spotify track."""
+    return {
+        "id": track.get("id", ""),
+        "name": track.get("name", "Unknown"),
+        "artists": track.get("artists", _DEFAULT_ARTISTS),
+        "album": (track.get("album") or _EMPTY).get("name", "Unknown"),
+        "duration_ms": track.get("duration_ms", 0),
+        "preview_url": track.get("preview_url", None),
+        "recommendation_reason": reason
+    }
+
 class RecommendationEngine:
     """Engine for generating music recommendations."""
     
     def __init__(self, spotify: SpotifyClient, database: Database):
         self.spotify = spotify
         self.database = database
-        
+        # Short-TTL LRU of (seed_track_id, limit) -> (expiry, tracks) plus an
+        # in-flight map so concurrent callers with the same seed share one
+        # Spotify round-trip
+        self._rec_cache: "OrderedDict[Tuple[str, int], Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._rec_ttl = 300  # seconds
+        self._rec_max = 512
+        self._rec_inflight: Dict[Tuple[str, int], asyncio.Future] = {}
+        # Cap concurrent Spotify recommendation fetches so batch callers
+        # don't saturate the shared connection pool
+        self._rec_sem = asyncio.Semaphore(10)
+
+
     async def get_recommendations_from_track(self, track_id: str, limit: int = 5) -> List[Dict[str, Any]]:
         """
         Get recommendations based on a specific track.
@@ -27,26 +58,68 @@ class RecommendationEngine:
         Returns:
             A list of track info dictionaries.
         """
+        cache_key = (track_id, limit)
+
+        # Serve fresh cache entries as copies so callers can annotate them
+        entry = self._rec_cache.get(cache_key)
+        if entry and entry[0] > time.monotonic():
+            self._rec_cache.move_to_end(cache_key)
+            return copy.deepcopy(entry[1])
+
+        # Join an in-flight fetch for the same seed if one exists
+        fut = self._rec_inflight.get(cache_key)
+        if fut is not None:
+            return copy.deepcopy(await fut)
+
+        fut = asyncio.get_running_loop().create_future()
+        self._rec_inflight[cache_key] = fut
+        try:
+            formatted = await self._fetch_recommendations(track_id, limit)
+
+            if formatted:
+                # Cache a pristine copy; the returned list may be mutated
+                self._rec_cache[cache_key] = (time.monotonic() + self._rec_ttl, copy.deepcopy(formatted))
+                self._rec_cache.move_to_end(cache_key)
+                if len(self._rec_cache) > self._rec_max:
+                    self._rec_cache.popitem(last=False)
+
+            fut.set_result(formatted)
+            return formatted
+        finally:
+            del self._rec_inflight[cache_key]
+
+    async def get_recommendations_batch(self, seed_track_ids: List[str],
+                                        limit: int = 5) -> List[List[Dict[str, Any]]]:
+        """
+        Get recommendations for several seed tracks concurrently.
+
+        Args:
+            seed_track_ids: Spotify track IDs to use as seeds.
+            limit: The maximum number of recommendations per seed.
+
+        Returns:
+            One recommendation list per seed, in the same order as the seeds.
+        """
+        async def fetch_one(seed_id: str) -> List[Dict[str, Any]]:
+            async with self._rec_sem:
+                return await self.get_recommendations_from_track(seed_id, limit=limit)
+
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(fetch_one(seed_id)) for seed_id in seed_track_ids]
+
+        return [task.result() for task in tasks]
+
+    async def _fetch_recommendations(self, track_id: str, limit: int) -> List[Dict[str, Any]]:
+        """Fetch and format recommendations for a seed track from Spotify."""
         try:
             # Use Spotify's recommendation API
             recommendations = await self.spotify.get_recommendations_by_track(track_id, limit=limit)
-            
+
             # Format the response
-            formatted = []
-            for track in recommendations:
-                formatted.append({
-                    "id": track.get("id", ""),
-                    "name": track.get("name", "Unknown"),
-                    "artists": track.get("artists", [{"name": "Unknown"}]),
-                    "album": track.get("album", {}).get("name", "Unknown"),
-                    "duration_ms": track.get("duration_ms", 0),
-                    "preview_url": track.get("preview_url", None),
-                    "recommendation_reason": "Based on your recent listening"
-                })
-            
-            return formatted
+            return [_format_track(track, "Based on your recent listening")
+                    for track in recommendations]
         except Exception as e:
-            logger.error(f"Error getting recommendations for track {track_id}: {e}", exc_info=True)
+            logger.error("Error getting recommendations for track %s: %s", track_id, e, exc_info=True)
             return []
     
     async def get_personalized_recommendations(self, user_id: int, limit: int = 5) -> List[Dict[str, Any]]:
@@ -61,13 +134,17 @@ class RecommendationEngine:
             A list of track info dictionaries.
         """
         try:
-            # Get user's recent listening history from database
-            stats = await self.database.get_user_stats(user_id)
+            # Fetch listening history and favorites concurrently; they're
+            # independent reads and the favorites fallback is common enough
+            # that prefetching it wins more than it wastes
+            stats, favorites = await asyncio.gather(
+                self.database.get_user_stats(user_id),
+                self.database.get_user_favorites(user_id, limit=5)
+            )
             top_tracks = stats.get("most_played_tracks", [])
-            
+
             if not top_tracks:
-                # If no history, try getting user's favorites
-                favorites = await self.database.get_user_favorites(user_id, limit=5)
+                # If no history, fall back to the user's favorites
                 if favorites:
                     # Use first favorite track as seed
                     seed_track = favorites[0].get("track_id", "")
@@ -88,7 +165,7 @@ class RecommendationEngine:
                 
             return recommendations
         except Exception as e:
-            logger.error(f"Error getting personalized recommendations for user {user_id}: {e}", exc_info=True)
+            logger.error("Error getting personalized recommendations for user %s: %s", user_id, e, exc_info=True)
             return []
     
     async def get_group_recommendations(self, chat_id: int, limit: int = 5) -> List[Dict[str, Any]]:
@@ -122,7 +199,7 @@ class RecommendationEngine:
                 
             return recommendations
         except Exception as e:
-            logger.error(f"Error getting group recommendations for chat {chat_id}: {e}", exc_info=True)
+            logger.error("Error getting group recommendations for chat %s: %s", chat_id, e, exc_info=True)
             return []
             
     async def get_trending_recommendations(self, limit: int = 5) -> List[Dict[str, Any]]:
@@ -138,21 +215,9 @@ class RecommendationEngine:
         try:
             # Get trending tracks from Spotify
             trending = await self.spotify.get_trending_tracks(limit=limit)
-            
+
             # Format the response
-            formatted = []
-            for track in trending:
-                formatted.append({
-                    "id": track.get("id", ""),
-                    "name": track.get("name", "Unknown"),
-                    "artists": track.get("artists", [{"name": "Unknown"}]),
-                    "album": track.get("album", {}).get("name", "Unknown"),
-                    "duration_ms": track.get("duration_ms", 0),
-                    "preview_url": track.get("preview_url", None),
-                    "recommendation_reason": "Currently trending"
-                })
-            
-            return formatted
+            return [_format_track(track, "Currently trending") for track in trending]
         except Exception as e:
-            logger.error(f"Error getting trending recommendations: {e}", exc_info=True)
+            logger.error("Error getting trending recommendations: %s", e, exc_info=True)
             return []
\ No newline at end of file
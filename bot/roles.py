@@ -2,7 +2,8 @@
 import logging
 import asyncio
 import time
-from typing import List, Dict, Any, Optional, Set
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Set, Tuple
 
 from bot.database import Database
 
@@ -19,9 +20,20 @@ class RoleManager:
             database: Database instance for storing role information.
         """
         self.database = database
-        self.role_cache = {}  # chat_id -> {user_id: role}
+        # LRU of chat_id -> (expiry_monotonic, {user_id: role}); bounded so
+        # the cache cannot grow with every chat the bot has ever seen
+        self._role_cache: "OrderedDict[int, Tuple[float, Dict[str, str]]]" = OrderedDict()
+        self._max_cached_chats = 1024
         self.role_ttl = 300  # 5 minutes
-        self.role_cache_timestamps = {}  # chat_id -> timestamp
+        # In-flight role loads per chat so concurrent cache misses share one
+        # database read instead of each triggering their own
+        self._inflight: Dict[int, asyncio.Future] = {}
+        # Write-behind buffer: role mutations update the in-memory document
+        # and a short debounce flushes one save per burst instead of one
+        # full-file write per mutation
+        self._dirty: Dict[int, Dict[str, Any]] = {}  # chat_id -> pending document
+        self._flush_tasks: Dict[int, asyncio.Task] = {}
+        self._flush_delay = 0.25  # seconds
         
         # Define role hierarchy and permissions
         self.roles = {
@@ -62,6 +74,12 @@ class RoleManager:
                 "permissions": []
             }
         }
+
+        # Freeze permissions so has_permission is a hash lookup instead of a
+        # list scan, and flatten levels for get_role_level
+        for role_config in self.roles.values():
+            role_config["permissions"] = frozenset(role_config["permissions"])
+        self._role_levels = {name: cfg["level"] for name, cfg in self.roles.items()}
     
     async def get_user_role(self, chat_id: int, user_id: int) -> str:
         """
@@ -74,19 +92,68 @@ class RoleManager:
         Returns:
             The role name (admin, dj, vip, user, restricted).
         """
-        # First, check if roles for this chat are cached and valid
-        if chat_id in self.role_cache and chat_id in self.role_cache_timestamps:
-            if time.time() - self.role_cache_timestamps[chat_id] < self.role_ttl:
-                return self.role_cache.get(chat_id, {}).get(user_id, "user")
-        
+        # First, check if roles for this chat are cached and fresh
+        entry = self._role_cache.get(chat_id)
+        if entry and entry[0] > time.monotonic():
+            self._role_cache.move_to_end(chat_id)
+            return entry[1].get(str(user_id), "user")
+
         # If not cached or expired, load from database
-        chat_roles = await self.database._get_from_file(f"roles_{chat_id}", {})
-        
+        chat_roles = await self._load_chat_roles(chat_id)
+
         # Update cache
-        self.role_cache[chat_id] = chat_roles.get("roles", {})
-        self.role_cache_timestamps[chat_id] = time.time()
-        
-        return self.role_cache[chat_id].get(str(user_id), "user")
+        roles = chat_roles.get("roles", {})
+        self._cache_chat_roles(chat_id, roles)
+
+        return roles.get(str(user_id), "user")
+
+    async def _load_chat_roles(self, chat_id: int) -> Dict[str, Any]:
+        """
+        Load a chat's roles document, coalescing concurrent callers.
+
+        Args:
+            chat_id: The Telegram chat ID.
+
+        Returns:
+            The roles document for the chat.
+        """
+        # Unflushed mutations are the freshest state for this chat
+        dirty = self._dirty.get(chat_id)
+        if dirty is not None:
+            return dirty
+
+        fut = self._inflight.get(chat_id)
+        if fut is not None:
+            # Another caller is already loading this chat; share its result
+            return await fut
+
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[chat_id] = fut
+        try:
+            chat_roles = await self.database._get_from_file(
+                f"roles_{chat_id}", {"chat_id": chat_id, "roles": {}}
+            )
+            fut.set_result(chat_roles)
+            return chat_roles
+        except Exception as e:
+            fut.set_exception(e)
+            raise
+        finally:
+            del self._inflight[chat_id]
+
+    def _cache_chat_roles(self, chat_id: int, roles: Dict[str, str]):
+        """
+        Store a chat's roles in the LRU cache, evicting the oldest entry
+        when the cap is exceeded.
+
+        Args:
+            chat_id: The Telegram chat ID.
+            roles: Mapping of user_id (as string) to role name.
+        """
+        self._role_cache[chat_id] = (time.monotonic() + self.role_ttl, roles)
+        self._role_cache.move_to_end(chat_id)
+        if len(self._role_cache) > self._max_cached_chats:
+            self._role_cache.popitem(last=False)
     
     async def set_user_role(self, chat_id: int, user_id: int, role: str) -> bool:
         """
@@ -102,24 +169,21 @@ class RoleManager:
         """
         # Verify role is valid
         if role not in self.roles:
-            logger.error(f"Invalid role: {role}")
+            logger.error("Invalid role: %s", role)
             return False
         
         # Get existing roles
-        chat_roles = await self.database._get_from_file(f"roles_{chat_id}", {"chat_id": chat_id, "roles": {}})
+        chat_roles = await self._load_chat_roles(chat_id)
         
         # Update role
         chat_roles["roles"][str(user_id)] = role
-        
-        # Save to database
-        await self.database._save_to_file(f"roles_{chat_id}", chat_roles)
-        
+
+        # Buffer the write; a debounced flush persists the whole burst once
+        self._mark_dirty(chat_id, chat_roles)
+
         # Update cache
-        if chat_id not in self.role_cache:
-            self.role_cache[chat_id] = {}
-        self.role_cache[chat_id][str(user_id)] = role
-        self.role_cache_timestamps[chat_id] = time.time()
-        
+        self._cache_chat_roles(chat_id, chat_roles["roles"])
+
         return True
     
     async def remove_user_role(self, chat_id: int, user_id: int) -> bool:
@@ -134,25 +198,58 @@ class RoleManager:
             True if successful, False otherwise.
         """
         # Get existing roles
-        chat_roles = await self.database._get_from_file(f"roles_{chat_id}", {"chat_id": chat_id, "roles": {}})
+        chat_roles = await self._load_chat_roles(chat_id)
         
         # Remove role if exists
         user_id_str = str(user_id)
         if user_id_str in chat_roles["roles"]:
             del chat_roles["roles"][user_id_str]
-            
-            # Save to database
-            await self.database._save_to_file(f"roles_{chat_id}", chat_roles)
-            
+
+            # Buffer the write; a debounced flush persists the whole burst once
+            self._mark_dirty(chat_id, chat_roles)
+
             # Update cache
-            if chat_id in self.role_cache and user_id_str in self.role_cache[chat_id]:
-                del self.role_cache[chat_id][user_id_str]
-            
+            self._cache_chat_roles(chat_id, chat_roles["roles"])
+
             return True
         
         # No role to remove
         return False
     
+    def _mark_dirty(self, chat_id: int, chat_roles: Dict[str, Any]):
+        """
+        Record a pending roles document and schedule its debounced flush.
+
+        Args:
+            chat_id: The Telegram chat ID.
+            chat_roles: The full roles document to persist.
+        """
+        self._dirty[chat_id] = chat_roles
+        if chat_id not in self._flush_tasks:
+            self._flush_tasks[chat_id] = asyncio.create_task(self._flush_after(chat_id))
+
+    async def _flush_after(self, chat_id: int):
+        """Persist a chat's pending roles document after the debounce delay."""
+        try:
+            await asyncio.sleep(self._flush_delay)
+            chat_roles = self._dirty.pop(chat_id, None)
+            if chat_roles is not None:
+                await self.database._save_to_file(f"roles_{chat_id}", chat_roles)
+        except Exception as e:
+            logger.error("Error flushing roles for chat %s: %s", chat_id, e, exc_info=True)
+        finally:
+            self._flush_tasks.pop(chat_id, None)
+
+    async def flush_pending(self):
+        """Immediately persist all buffered role changes (call on shutdown)."""
+        for task in list(self._flush_tasks.values()):
+            task.cancel()
+        self._flush_tasks.clear()
+
+        for chat_id, chat_roles in list(self._dirty.items()):
+            await self.database._save_to_file(f"roles_{chat_id}", chat_roles)
+        self._dirty.clear()
+
     async def get_users_with_role(self, chat_id: int, role: str) -> List[int]:
         """
         Get all users with a specific role in a chat.
@@ -165,7 +262,7 @@ class RoleManager:
             List of user IDs with the specified role.
         """
         # Get existing roles
-        chat_roles = await self.database._get_from_file(f"roles_{chat_id}", {"chat_id": chat_id, "roles": {}})
+        chat_roles = await self._load_chat_roles(chat_id)
         
         # Find users with the specified role
         return [int(user_id) for user_id, user_role in chat_roles["roles"].items() if user_role == role]
@@ -212,11 +309,8 @@ class RoleManager:
         Returns:
             The role level (higher is more privileged).
         """
-        if role not in self.roles:
-            # Default to user level for unknown roles
-            return self.roles["user"]["level"]
-        
-        return self.roles[role]["level"]
+        # Default to user level for unknown roles
+        return self._role_levels.get(role, self._role_levels["user"])
     
     async def get_user_role_level(self, chat_id: int, user_id: int) -> int:
         """
@@ -241,10 +335,7 @@ class RoleManager:
         """
         if chat_id is None:
             # Clear all cache
-            self.role_cache = {}
-            self.role_cache_timestamps = {}
-        elif chat_id in self.role_cache:
+            self._role_cache.clear()
+        else:
             # Clear cache for specific chat
-            del self.role_cache[chat_id]
-            if chat_id in self.role_cache_timestamps:
-                del self.role_cache_timestamps[chat_id]
\ No newline at end of file
+            self._role_cache.pop(chat_id, None)
\ No newline at end of file
@@ -5,57 +5,218 @@ import logging
 import base64
 import time
 import json
-import aiofiles
-from urllib.parse import quote
+from collections import OrderedDict
 from mutagen.mp3 import MP3
 
+try:
+    # orjson decodes the ~10 KB search payloads several times faster than
+    # stdlib json; fall back silently when it isn't installed
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# Bump to invalidate every cached audio file at the next startup (e.g. if
+# the downloaded format or bitrate ever changes)
+CACHE_VERSION = 2
+_CACHE_SUFFIX = f".v{CACHE_VERSION}.mp3"
+
+
+_MPEG_SAMPLE_RATES = (44100, 48000, 32000)
+
+
+def _fast_mp3_duration(path):
+    """Compute mp3 duration from a Xing/Info header without a full scan.
+
+    Encoders (LAME included) put a Xing (VBR) or Info (CBR) tag carrying
+    the total frame count in the first mp3 frame, so the duration is
+    frames * samples_per_frame / sample_rate from a single 4 KB read.
+    Returns None when the header is absent or unreadable, in which case
+    the caller should fall back to a full mutagen parse.
+    """
+    with open(path, "rb") as f:
+        head = f.read(4096)
+
+    idx = head.find(b"Xing")
+    if idx < 0:
+        idx = head.find(b"Info")
+    if idx < 0 or idx + 12 > len(head):
+        return None
+
+    flags = int.from_bytes(head[idx + 4:idx + 8], "big")
+    if not flags & 1:  # no frame-count field
+        return None
+    frames = int.from_bytes(head[idx + 8:idx + 12], "big")
+
+    # Walk back to the MPEG frame sync to read version and sample rate
+    sync = head.rfind(b"\xff", 0, idx)
+    while sync >= 0 and (sync + 3 >= len(head) or head[sync + 1] & 0xe0 != 0xe0):
+        sync = head.rfind(b"\xff", 0, sync)
+    if sync < 0:
+        return None
+
+    version_bits = (head[sync + 1] >> 3) & 0x03
+    rate_bits = (head[sync + 2] >> 2) & 0x03
+    if rate_bits == 3 or version_bits == 1:
+        return None
+    rate = _MPEG_SAMPLE_RATES[rate_bits]
+
+    if version_bits == 3:  # MPEG1: 1152 samples per layer-III frame
+        samples = 1152
+    else:  # MPEG2 (2) / MPEG2.5 (0): halved/quartered rate, 576 samples
+        rate //= 2 if version_bits == 2 else 4
+        samples = 576
+
+    if not frames or not rate:
+        return None
+    return frames * samples / rate
+
+
+def _format_track(track):
+    """Build the formatted track dict served to callers from an API track.
+
+    Binds nested lookups to locals once so each field is a single dict hit.
+    """
+    album = track["album"]
+    images = album["images"]
+    return {
+        "id": track["id"],
+        "name": track["name"],
+        "artists": ", ".join(artist["name"] for artist in track["artists"]),
+        "album": album["name"],
+        "duration_ms": track["duration_ms"],
+        "uri": track["uri"],
+        "preview_url": track["preview_url"],
+        "external_url": track["external_urls"]["spotify"],
+        "album_art": images[0]["url"] if images else None
+    }
+
+
 class SpotifyClient:
-    """Client for interacting with Spotify API."""
+    """Client for interacting with Spotify API.
+
+    All HTTP goes through a single pooled aiohttp session, so API calls
+    never block the event loop and need no thread-pool offloading.
+    """
     
-    def __init__(self, client_id, client_secret):
+    def __init__(self, client_id, client_secret, session=None):
         self.client_id = client_id
         self.client_secret = client_secret
         self.access_token = None
         self.token_expiry = 0
         self.base_url = "https://api.spotify.com/v1"
         self.auth_url = "https://accounts.spotify.com/api/token"
-        self.session = None
+        # Credentials never change, so the Basic auth header and the
+        # urlencoded form body can be built once instead of per refresh
+        auth_header = base64.b64encode(
+            f"{client_id}:{client_secret}".encode()
+        ).decode("utf-8")
+        self._auth_headers = {
+            "Authorization": f"Basic {auth_header}",
+            "Content-Type": "application/x-www-form-urlencoded"
+        }
+        self._auth_body = b"grant_type=client_credentials"
+        # Serialize token refreshes so a burst of 401s triggers one POST to
+        # the token endpoint instead of one per concurrent caller
+        self._token_lock = asyncio.Lock()
+        # Background task that renews the token shortly before expiry so
+        # request paths never pay the refresh round trip
+        self._refresh_task = None
+        # Short-TTL LRU of (endpoint, params) -> (expiry, response) plus an
+        # in-flight map so repeated queries (the /play workflow is highly
+        # repetitive) skip the API round trip and concurrent identical
+        # requests share one fetch
+        self._api_cache = OrderedDict()
+        self._api_ttl = 300  # seconds
+        self._api_max = 1024
+        self._api_inflight = {}
+        # An externally provided session is shared (and owned) by the
+        # caller, so token refreshes, API calls, and preview downloads all
+        # reuse the same keep-alive pools
+        self.session = session
+        self._owns_session = session is None
+        # Single-flight map: track_id -> future of an in-progress download,
+        # so two /play requests for the same track share one CDN fetch and
+        # never write the same cache file concurrently
+        self._downloads = {}
+        # file_path -> duration in seconds; a preview's duration never
+        # changes, so parse each file at most once per process
+        self._duration_cache = {}
         self.cache_dir = os.getenv("CACHE_DIR", "cache")
         
         # Create cache directory
         os.makedirs(self.cache_dir, exist_ok=True)
+
+        # Track ids already on disk; the download hot path checks this set
+        # instead of paying a stat syscall per request. Files from an older
+        # CACHE_VERSION (or leftover partials) are swept out here, so
+        # bumping the constant invalidates the whole cache in one startup.
+        self._cached_ids = set()
+        for entry in os.scandir(self.cache_dir):
+            name = entry.name
+            if name.endswith(_CACHE_SUFFIX):
+                self._cached_ids.add(name[:-len(_CACHE_SUFFIX)])
+            elif not name.endswith(_CACHE_SUFFIX + ".dur"):
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    pass
     
     async def initialize(self):
         """Initialize the client by getting an access token."""
-        self.session = aiohttp.ClientSession()
-        await self.get_access_token()
-    
+        await self.ensure_token()
+
+    async def ensure_token(self):
+        """Make sure the HTTP session exists and an access token is cached.
+
+        Safe to call from anywhere (e.g. as a boot-time prewarm task) before
+        initialize() has run; creates the pooled session on first use so the
+        TLS handshake and OAuth round trip happen off the hot path.
+        """
+        if self.session is None:
+            # One keep-alive pool for the token endpoint, the API, and the
+            # preview CDN; the DNS cache avoids a resolver hit per burst and
+            # cleanup_closed reaps half-closed TLS connections
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=20,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True,
+            )
+            self.session = aiohttp.ClientSession(connector=connector)
+        token = await self.get_access_token()
+        if self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+        return token
+
     async def get_access_token(self):
         """Get an access token from Spotify."""
         if self.access_token and time.time() < self.token_expiry - 60:
             return self.access_token
-        
-        auth_header = base64.b64encode(
-            f"{self.client_id}:{self.client_secret}".encode()
-        ).decode("utf-8")
-        
-        headers = {
-            "Authorization": f"Basic {auth_header}",
-            "Content-Type": "application/x-www-form-urlencoded"
-        }
-        
-        data = {"grant_type": "client_credentials"}
-        
+
+        async with self._token_lock:
+            # Double-check: another caller may have refreshed while we
+            # waited for the lock
+            if self.access_token and time.time() < self.token_expiry - 60:
+                return self.access_token
+
+            return await self._request_token()
+
+    async def _request_token(self):
+        """Unconditionally fetch a fresh token. Callers hold _token_lock."""
         try:
-            async with self.session.post(self.auth_url, headers=headers, data=data) as response:
+            async with self.session.post(
+                self.auth_url, headers=self._auth_headers, data=self._auth_body
+            ) as response:
                 if response.status != 200:
                     error_text = await response.text()
                     logger.error(f"Failed to get Spotify access token: {error_text}")
                     return None
-                
-                result = await response.json()
+
+                result = await response.json(loads=_json_loads)
                 self.access_token = result["access_token"]
                 self.token_expiry = time.time() + result["expires_in"]
                 logger.info("Got new Spotify access token")
@@ -63,62 +224,100 @@ class SpotifyClient:
         except Exception as e:
             logger.error(f"Error getting Spotify access token: {e}", exc_info=True)
             return None
+
+    async def _refresh_loop(self):
+        """Renew the access token ~5 minutes before it expires.
+
+        Callers keep reading the old (still valid) token while the refresh
+        happens in the background, so no request ever waits on the token
+        endpoint once the client is initialized.
+        """
+        while True:
+            delay = self.token_expiry - 300 - time.time()
+            await asyncio.sleep(max(delay, 30))
+            async with self._token_lock:
+                if time.time() >= self.token_expiry - 300:
+                    await self._request_token()
     
     async def _make_request(self, endpoint, params=None):
-        """Make a request to the Spotify API."""
+        """Make a request to the Spotify API, with a short-TTL cache."""
         if not self.session:
             logger.error("Session not initialized. Call initialize() first.")
             return None
-        
-        await self.get_access_token()
-        
-        headers = {"Authorization": f"Bearer {self.access_token}"}
+
+        cache_key = (endpoint, tuple(sorted(params.items())) if params else None)
+
+        entry = self._api_cache.get(cache_key)
+        if entry and entry[0] > time.monotonic():
+            self._api_cache.move_to_end(cache_key)
+            return entry[1]
+
+        # Join an in-flight request for the same endpoint if one exists
+        fut = self._api_inflight.get(cache_key)
+        if fut is not None:
+            return await fut
+
+        fut = asyncio.get_running_loop().create_future()
+        self._api_inflight[cache_key] = fut
+        try:
+            result = await self._request_json(endpoint, params)
+
+            if result is not None:
+                # Errors (None) are never cached, so transient failures
+                # don't suppress retries for five minutes
+                self._api_cache[cache_key] = (time.monotonic() + self._api_ttl, result)
+                self._api_cache.move_to_end(cache_key)
+                if len(self._api_cache) > self._api_max:
+                    self._api_cache.popitem(last=False)
+
+            fut.set_result(result)
+            return result
+        finally:
+            del self._api_inflight[cache_key]
+
+    async def _request_json(self, endpoint, params=None):
+        """Issue the actual GET against the Spotify API."""
+        # The background refresh keeps the token fresh; only block on the
+        # token endpoint when we have no token at all (first request)
+        if not self.access_token:
+            await self.get_access_token()
+
         url = f"{self.base_url}/{endpoint}"
-        
+
         try:
-            async with self.session.get(url, headers=headers, params=params) as response:
-                if response.status != 200:
+            # One retry after a 401: drop the token, refresh (serialized by
+            # the token lock), and reissue the request with the new token
+            for attempt in range(2):
+                headers = {"Authorization": f"Bearer {self.access_token}"}
+                async with self.session.get(url, headers=headers, params=params) as response:
+                    if response.status == 200:
+                        return await response.json(loads=_json_loads)
+
                     error_text = await response.text()
                     logger.error(f"Spotify API error: {error_text}")
-                    if response.status == 401:
+                    if response.status == 401 and attempt == 0:
                         # Token expired, try refreshing
                         self.access_token = None
                         await self.get_access_token()
-                        return await self._make_request(endpoint, params)
+                        continue
                     return None
-                
-                return await response.json()
+            return None
         except Exception as e:
             logger.error(f"Error making Spotify request: {e}", exc_info=True)
             return None
     
     async def search(self, query, limit=10):
         """Search for tracks on Spotify."""
-        encoded_query = quote(query)
-        endpoint = f"search?q={encoded_query}&type=track&limit={limit}"
-        result = await self._make_request(endpoint)
+        # Let aiohttp do canonical query encoding; normalized params also
+        # give the API cache a stable key for equivalent searches
+        result = await self._make_request(
+            "search", params={"q": query, "type": "track", "limit": limit}
+        )
         
         if not result or "tracks" not in result:
             return []
         
-        tracks = result["tracks"]["items"]
-        formatted_tracks = []
-        
-        for track in tracks:
-            artists = ", ".join([artist["name"] for artist in track["artists"]])
-            formatted_tracks.append({
-                "id": track["id"],
-                "name": track["name"],
-                "artists": artists,
-                "album": track["album"]["name"],
-                "duration_ms": track["duration_ms"],
-                "uri": track["uri"],
-                "preview_url": track["preview_url"],
-                "external_url": track["external_urls"]["spotify"],
-                "album_art": track["album"]["images"][0]["url"] if track["album"]["images"] else None
-            })
-        
-        return formatted_tracks
+        return [_format_track(track) for track in result["tracks"]["items"]]
     
     async def get_track(self, track_id):
         """Get track details by ID."""
@@ -128,18 +327,7 @@ class SpotifyClient:
         if not track:
             return None
         
-        artists = ", ".join([artist["name"] for artist in track["artists"]])
-        return {
-            "id": track["id"],
-            "name": track["name"],
-            "artists": artists,
-            "album": track["album"]["name"],
-            "duration_ms": track["duration_ms"],
-            "uri": track["uri"],
-            "preview_url": track["preview_url"],
-            "external_url": track["external_urls"]["spotify"],
-            "album_art": track["album"]["images"][0]["url"] if track["album"]["images"] else None
-        }
+        return _format_track(track)
     
     async def download_track(self, track_info):
         """Download track audio for playback in voice chats."""
@@ -152,48 +340,122 @@ class SpotifyClient:
             return None
         
         # Create a cache filename based on track ID
-        cache_file = os.path.join(self.cache_dir, f"{track_info['id']}.mp3")
-        
-        # Check if file already exists in cache
-        if os.path.exists(cache_file):
+        track_id = track_info["id"]
+        cache_file = os.path.join(self.cache_dir, f"{track_id}{_CACHE_SUFFIX}")
+
+        # Check if file already exists in cache (in-memory set, no stat)
+        if track_id in self._cached_ids:
             logger.info(f"Using cached track: {track_info['name']}")
             return {
                 "file_path": cache_file,
-                "duration": self.get_audio_duration(cache_file),
+                "duration": await self.get_audio_duration(cache_file),
                 **track_info
             }
-        
-        # Download the preview
+
+        # Coalesce concurrent downloads of the same track: later callers
+        # await the first caller's future instead of racing it to the CDN
+        fut = self._downloads.get(track_id)
+        if fut is not None:
+            return await fut
+
+        fut = asyncio.get_running_loop().create_future()
+        self._downloads[track_id] = fut
+        try:
+            result = await self._download_preview(track_info, cache_file)
+            fut.set_result(result)
+            return result
+        finally:
+            del self._downloads[track_id]
+
+    async def _download_preview(self, track_info, cache_file):
+        """Fetch the preview from the CDN and stream it into the cache."""
+        # Download the preview, streaming chunks straight to disk so the
+        # whole file is never buffered in memory. The write goes to a .part
+        # temp file renamed into place on success, so a failed download can
+        # never poison the cache with a truncated mp3.
+        tmp_file = cache_file + ".part"
         try:
             async with self.session.get(track_info["preview_url"]) as response:
                 if response.status != 200:
                     logger.error(f"Failed to download track: {await response.text()}")
                     return None
-                
-                content = await response.read()
-                
-                async with aiofiles.open(cache_file, "wb") as f:
-                    await f.write(content)
-                
-                logger.info(f"Downloaded track: {track_info['name']}")
-                
-                return {
-                    "file_path": cache_file,
-                    "duration": self.get_audio_duration(cache_file),
-                    **track_info
-                }
+
+                # Plain os.write on a worker thread: same non-blocking
+                # behavior as aiofiles without its per-call wrapper objects
+                fd = await asyncio.to_thread(
+                    os.open, tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644
+                )
+                try:
+                    async for chunk in response.content.iter_chunked(65536):
+                        await asyncio.to_thread(os.write, fd, chunk)
+                finally:
+                    await asyncio.to_thread(os.close, fd)
+
+            os.replace(tmp_file, cache_file)
+            self._cached_ids.add(track_info["id"])
+            logger.info(f"Downloaded track: {track_info['name']}")
+
+            return {
+                "file_path": cache_file,
+                "duration": await self.get_audio_duration(cache_file),
+                **track_info
+            }
         except Exception as e:
             logger.error(f"Error downloading track: {e}", exc_info=True)
+            # Drop the partial file so the next attempt starts clean
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
             return None
     
-    def get_audio_duration(self, file_path):
-        """Get the duration of an audio file in seconds."""
+    async def get_audio_duration(self, file_path):
+        """Get the duration of an audio file in seconds.
+
+        Checks the in-memory cache, then a .dur sidecar written on first
+        parse (so warm restarts skip mutagen too), and only then parses the
+        mp3 itself. The file I/O and parse run in a worker thread so the
+        event loop never blocks on them.
+        """
+        duration = self._duration_cache.get(file_path)
+        if duration is not None:
+            return duration
+
+        return await asyncio.to_thread(self._read_duration_sync, file_path)
+
+    def _read_duration_sync(self, file_path):
+        """Blocking duration lookup: sidecar first, then a mutagen parse."""
+        sidecar = file_path + ".dur"
         try:
-            audio = MP3(file_path)
-            return audio.info.length
-        except Exception as e:
-            logger.error(f"Error getting audio duration: {e}")
-            return 0
+            with open(sidecar, "r") as f:
+                duration = float(f.read())
+            self._duration_cache[file_path] = duration
+            return duration
+        except (OSError, ValueError):
+            pass
+
+        # Cheap path first: a Xing/Info header gives the duration from one
+        # 4 KB read instead of mutagen walking every frame
+        try:
+            duration = _fast_mp3_duration(file_path)
+        except Exception:
+            duration = None
+
+        if duration is None:
+            try:
+                audio = MP3(file_path)
+                duration = audio.info.length
+            except Exception as e:
+                logger.error(f"Error getting audio duration: {e}")
+                return 0
+
+        self._duration_cache[file_path] = duration
+        try:
+            with open(sidecar, "w") as f:
+                f.write(repr(duration))
+        except OSError:
+            pass
+        return duration
     
     async def get_recommendations_by_track(self, track_id, limit=5):
         """Get track recommendations based on a seed track."""
@@ -203,24 +465,7 @@ class SpotifyClient:
         if not result or "tracks" not in result:
             return []
         
-        tracks = result["tracks"]
-        formatted_tracks = []
-        
-        for track in tracks:
-            artists = ", ".join([artist["name"] for artist in track["artists"]])
-            formatted_tracks.append({
-                "id": track["id"],
-                "name": track["name"],
-                "artists": artists,
-                "album": track["album"]["name"],
-                "duration_ms": track["duration_ms"],
-                "uri": track["uri"],
-                "preview_url": track["preview_url"],
-                "external_url": track["external_urls"]["spotify"],
-                "album_art": track["album"]["images"][0]["url"] if track["album"]["images"] else None
-            })
-        
-        return formatted_tracks
+        return [_format_track(track) for track in result["tracks"]]
         
     async def get_recommendations_by_artists(self, artist_ids, limit=5):
         """Get track recommendations based on seed artists."""
@@ -234,24 +479,7 @@ class SpotifyClient:
         if not result or "tracks" not in result:
             return []
         
-        tracks = result["tracks"]
-        formatted_tracks = []
-        
-        for track in tracks:
-            artists = ", ".join([artist["name"] for artist in track["artists"]])
-            formatted_tracks.append({
-                "id": track["id"],
-                "name": track["name"],
-                "artists": artists,
-                "album": track["album"]["name"],
-                "duration_ms": track["duration_ms"],
-                "uri": track["uri"],
-                "preview_url": track["preview_url"],
-                "external_url": track["external_urls"]["spotify"],
-                "album_art": track["album"]["images"][0]["url"] if track["album"]["images"] else None
-            })
-        
-        return formatted_tracks
+        return [_format_track(track) for track in result["tracks"]]
         
     async def get_recommendations_by_genres(self, genres, limit=5):
         """Get track recommendations based on seed genres."""
@@ -265,24 +493,7 @@ class SpotifyClient:
         if not result or "tracks" not in result:
             return []
         
-        tracks = result["tracks"]
-        formatted_tracks = []
-        
-        for track in tracks:
-            artists = ", ".join([artist["name"] for artist in track["artists"]])
-            formatted_tracks.append({
-                "id": track["id"],
-                "name": track["name"],
-                "artists": artists,
-                "album": track["album"]["name"],
-                "duration_ms": track["duration_ms"],
-                "uri": track["uri"],
-                "preview_url": track["preview_url"],
-                "external_url": track["external_urls"]["spotify"],
-                "album_art": track["album"]["images"][0]["url"] if track["album"]["images"] else None
-            })
-        
-        return formatted_tracks
+        return [_format_track(track) for track in result["tracks"]]
         
     async def get_trending_tracks(self, limit=10):
         """Get trending tracks based on featured playlists."""
@@ -310,20 +521,7 @@ class SpotifyClient:
             if playlist_tracks and "items" in playlist_tracks:
                 for item in playlist_tracks["items"]:
                     if "track" in item and item["track"]:
-                        track = item["track"]
-                        artists = ", ".join([artist["name"] for artist in track["artists"]])
-                        formatted_track = {
-                            "id": track["id"],
-                            "name": track["name"],
-                            "artists": artists,
-                            "album": track["album"]["name"],
-                            "duration_ms": track["duration_ms"],
-                            "uri": track["uri"],
-                            "preview_url": track["preview_url"],
-                            "external_url": track["external_urls"]["spotify"],
-                            "album_art": track["album"]["images"][0]["url"] if track["album"]["images"] else None
-                        }
-                        trending_tracks.append(formatted_track)
+                        trending_tracks.append(_format_track(item["track"]))
                         if len(trending_tracks) >= limit:
                             break
             
@@ -333,6 +531,9 @@ class SpotifyClient:
         return trending_tracks
     
     async def close(self):
-        """Close the aiohttp session."""
-        if self.session:
+        """Stop the token refresher and close any owned aiohttp session."""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+        if self.session and self._owns_session:
             await self.session.close()
@@ -1,6 +1,8 @@
 import logging
 import time
 import asyncio
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Dict, List, Union, Optional, Tuple, Any
 from pyrogram import (
     types
@@ -13,8 +15,42 @@ from pyrogram.types import (
     Message
 )
 
+from pyrogram.enums import ChatType
+
+from .helpers import format_duration
+from .image_ui import ImageUI
+
 logger = logging.getLogger(__name__)
 
+# Template for the now-playing text shared by send and update paths
+_NOW_PLAYING_TMPL = (
+    "🎵 **Now Playing**\n\n"
+    "**{name}**\n"
+    "👤 {artists}\n"
+    "💽 {album}\n"
+    "⏱️ {dur}\n"
+    "{link}"
+)
+
+
+def _render_now_playing(track):
+    """Render the now-playing text for a track."""
+    # duration_ms never changes after fetch, so the formatted string is
+    # memoized on the track dict across refreshes
+    dur = track.get('_duration_str')
+    if dur is None:
+        dur = format_duration(track['duration_ms'])
+        track['_duration_str'] = dur
+    external_url = track.get('external_url')
+    link = f"\n[Listen on Spotify]({external_url})" if external_url else ""
+    return _NOW_PLAYING_TMPL.format(
+        name=track['name'],
+        artists=track['artists'],
+        album=track['album'],
+        dur=dur,
+        link=link
+    )
+
 # Button text constants
 PLAY_BUTTON = "▶️ Play"
 PAUSE_BUTTON = "⏸ Pause"
@@ -28,8 +64,71 @@ SEARCH_BUTTON = "🔍 Search"
 REFRESH_BUTTON = "🔄 Refresh"
 BACK_BUTTON = "⬅️ Back"
 
+# Queue-pagination callback prefix; the length is precomputed so the page
+# number can be sliced out without re-splitting the whole string
+_QP_PREFIX = "music_queue_page_"
+_QP_LEN = len(_QP_PREFIX)
+
+# Quiz-answer callback prefix, sliced the same way
+_QA_PREFIX = "quiz_answer_"
+_QA_LEN = len(_QA_PREFIX)
+
+# Per-chat roster cache for quiz callbacks: enumerating every chat
+# member is O(members) in Telegram round trips, far too slow to repeat on
+# each button press, so the {user_id: username} map is kept for a TTL
+_USERNAMES_TTL = 300
+_chat_usernames = {}  # chat_id -> (expiry, {user_id: username})
+
+# Names of users who actually interacted with a quiz, filled in from the
+# callback itself — answering needs no roster walk at all
+_quiz_usernames = {}  # chat_id -> {user_id: username}
+
+# In-flight roster fetches, so concurrent callbacks in the same chat
+# share one member walk instead of each starting their own
+_usernames_inflight = {}  # chat_id -> asyncio.Future
+
+
+async def _get_usernames_cached(client, chat_id, chat_type=None, ttl=_USERNAMES_TTL):
+    """Return the chat's {user_id: username} map, enumerating at most once per TTL."""
+    cached = _chat_usernames.get(chat_id)
+    if cached is not None and time.monotonic() < cached[0]:
+        return cached[1]
+
+    # Single-flight: if another caller is already walking the roster,
+    # await its result rather than issuing a duplicate enumeration
+    inflight = _usernames_inflight.get(chat_id)
+    if inflight is not None:
+        return await asyncio.shield(inflight)
+
+    future = asyncio.get_running_loop().create_future()
+    _usernames_inflight[chat_id] = future
+
+    usernames = {}
+    try:
+        # The chat type usually rides along on the update that got us
+        # here; only fall back to a get_chat RPC when it doesn't
+        if chat_type is None:
+            chat_type = (await client.get_chat(chat_id)).type
+        if chat_type != ChatType.PRIVATE:
+            async for member in client.get_chat_members(chat_id):
+                if member.user and not member.user.is_bot:
+                    usernames[member.user.id] = member.user.username or member.user.first_name
+    except Exception as e:
+        logger.error(f"Error getting chat members: {e}")
+    finally:
+        _chat_usernames[chat_id] = (time.monotonic() + ttl, usernames)
+        _usernames_inflight.pop(chat_id, None)
+        future.set_result(usernames)
+    return usernames
+
+
 def create_ui_components(bot):
     """Register UI components and handlers."""
+
+    # One shared ImageUI for every render path; the old per-function lazy
+    # init raced under concurrent callbacks and loaded fonts repeatedly
+    if not hasattr(bot, "image_ui"):
+        bot.image_ui = ImageUI()
     
     @bot.on_callback_query(filters=lambda query: query.data.startswith("quiz_"))
     async def handle_quiz_callback(client, callback_query):
@@ -39,7 +138,6 @@ def create_ui_components(bot):
         message_id = callback_query.message.id
         user_id = callback_query.from_user.id
         
-        from .music_quiz import MusicQuiz
         
         # Get instance from bot
         quiz_manager = getattr(client, "quiz_manager", None)
@@ -51,279 +149,528 @@ def create_ui_components(bot):
         
         # Get active quiz for this chat
         active_quiz = quiz_manager.get_quiz(chat_id)
-        
-        # Handle different quiz callback actions
-        if data == "quiz_new":
-            if active_quiz and active_quiz.is_active():
-                await callback_query.answer("A quiz is already in progress!")
-                return
-            
-            # Create a new quiz with default settings
-            await callback_query.answer("Creating new quiz...")
-            
-            # Get user info for username mapping
-            usernames = {}
-            try:
-                chat = await client.get_chat(chat_id)
-                if chat.type != "private":
-                    async for member in client.get_chat_members(chat_id):
-                        if member.user and not member.user.is_bot:
-                            usernames[member.user.id] = member.user.username or member.user.first_name
-            except Exception as e:
-                logger.error(f"Error getting chat members: {e}")
-            
-            # Create new quiz
-            new_quiz = await quiz_manager.create_quiz(
-                chat_id=chat_id,
-                creator_id=user_id,
-                num_questions=5  # Default number of questions
-            )
-            
-            if new_quiz:
-                # Send first question
-                await new_quiz.send_question(client, chat_id, usernames)
-                await callback_query.message.delete()
-            else:
-                await callback_query.answer("Failed to create a new quiz. Please try again later.")
-        
-        elif data.startswith("quiz_answer_"):
-            if not active_quiz:
-                await callback_query.answer("No active quiz in this chat.")
-                return
-                
-            # Extract answer option index
-            try:
-                option_index = int(data.split("_")[-1])
-            except ValueError:
-                await callback_query.answer("Invalid option.")
-                return
-            
-            # Record the user's answer
-            answer_added, is_correct, points = active_quiz.add_answer(user_id, option_index)
-            
-            if not answer_added:
-                await callback_query.answer("You already answered this question!")
-                return
-            
-            # Inform the user about their answer
-            if is_correct:
-                await callback_query.answer(f"Correct! +{points} points")
-            else:
-                await callback_query.answer("Incorrect!")
-                
-            # Check if all users have answered or time is up
-            # If this is the last person to answer, move to next question
-            users_answered = len(active_quiz.get_current_question().answered_by)
-            
-            # Get user info for username mapping
-            usernames = {}
-            try:
-                chat = await client.get_chat(chat_id)
-                if chat.type != "private":
-                    async for member in client.get_chat_members(chat_id):
-                        if member.user and not member.user.is_bot:
-                            usernames[member.user.id] = member.user.username or member.user.first_name
-            except Exception as e:
-                logger.error(f"Error getting chat members: {e}")
-            
-            # Move to next question if we've hit the threshold
-            # For simplicity, we'll continue after a certain number of answers or a fixed time delay
-            chat_participants = len(usernames) or 5
-            answer_threshold = min(chat_participants, 5)  # Either all users or max 5
-            
-            if users_answered >= answer_threshold:
-                # Show correct answer
-                correct_answer = active_quiz.get_current_question().get_correct_answer()
-                correct_details = active_quiz.get_current_question().get_correct_answer_details()
-                
-                await client.send_message(
-                    chat_id=chat_id,
-                    text=f"⏱ Time's up!\n\n✅ The correct answer is: **{correct_answer}**\n{correct_details}"
-                )
-                
-                # Delay for a moment to let users see the correct answer
-                await asyncio.sleep(3)
-                
-                # Move to next question
-                next_question = active_quiz.next_question()
-                
-                if next_question:
-                    # Send next question
-                    await active_quiz.send_question(client, chat_id, usernames)
-                else:
-                    # End of quiz, show results
-                    await active_quiz.send_results(client, chat_id, usernames)
-                    quiz_manager.end_quiz(chat_id)
-        
-        elif data == "quiz_end":
-            if not active_quiz:
-                await callback_query.answer("No active quiz to end.")
-                return
-            
-            # Get user info for username mapping
-            usernames = {}
-            try:
-                chat = await client.get_chat(chat_id)
-                if chat.type != "private":
-                    async for member in client.get_chat_members(chat_id):
-                        if member.user and not member.user.is_bot:
-                            usernames[member.user.id] = member.user.username or member.user.first_name
-            except Exception as e:
-                logger.error(f"Error getting chat members: {e}")
-            
-            # Show results and end quiz
-            await active_quiz.send_results(client, chat_id, usernames)
-            quiz_manager.end_quiz(chat_id)
-            await callback_query.answer("Quiz ended.")
-            
-            # Delete the callback message
-            try:
-                await callback_query.message.delete()
-            except Exception as e:
-                logger.error(f"Failed to delete message: {e}")
+
+        # O(1) routing, mirroring the music dispatch table; the only
+        # parameterized action (answer selection) is handled below
+        handler = _QUIZ_HANDLERS.get(data)
+        if handler is not None:
+            await handler(client, callback_query, chat_id, user_id,
+                          quiz_manager, active_quiz)
+        elif data.startswith(_QA_PREFIX):
+            await _quiz_answer(client, callback_query, chat_id, user_id,
+                               quiz_manager, active_quiz, data[_QA_LEN:])
     
-    @bot.on_callback_query(filters=lambda query: query.data.startswith("music_"))
+    # Accept only the exact actions this handler dispatches (plus
+    # pagination); unrelated music_* callbacks from other keyboards no
+    # longer match and the filter stays O(1) per callback
+    @bot.on_callback_query(
+        filters=lambda query: query.data in _MUSIC_ACTIONS or query.data.startswith(_QP_PREFIX)
+    )
     async def handle_music_callback(client, callback_query):
         """Handle callback queries for music controls."""
         data = callback_query.data
         chat_id = callback_query.message.chat.id
         message_id = callback_query.message.id
-        user_id = callback_query.from_user.id
-        
-        from .voice_chat import VoiceChat
-        from .queue_manager import QueueManager
-        
+
         # Get instances from bot
         voice_chat = getattr(client, "voice_chat", None)
         queue_manager = getattr(client, "queue_manager", None)
-        
+
         if not voice_chat or not queue_manager:
             logger.error("Voice chat or queue manager not initialized")
             await callback_query.answer("Bot is not fully initialized, please try again later.")
             return
-        
-        # Handle different callback actions
-        if data == "music_pause":
-            success, message = await voice_chat.pause(chat_id)
-            if success:
-                await update_player_controls(client, chat_id, message_id, is_paused=True)
-            await callback_query.answer(message)
-            
-        elif data == "music_resume":
-            success, message = await voice_chat.resume(chat_id)
-            if success:
-                await update_player_controls(client, chat_id, message_id, is_paused=False)
-            await callback_query.answer(message)
-            
-        elif data == "music_skip":
-            success, message = await voice_chat.skip(chat_id)
-            if success:
-                current_track = voice_chat.active_calls[chat_id]["current_track"]
-                await update_now_playing(client, chat_id, message_id, current_track)
-            await callback_query.answer(message)
-            
-        elif data == "music_stop":
-            success, message = await voice_chat.leave_voice_chat(chat_id)
-            if success:
-                await callback_query.message.edit_text(
-                    "⏹️ Playback stopped and left voice chat",
-                    reply_markup=None
-                )
-            await callback_query.answer(message)
-            
-        elif data == "music_volume_up":
-            current_volume = voice_chat.active_calls.get(chat_id, {}).get("volume", 100)
-            new_volume = min(current_volume + 10, 200)
-            success, message = await voice_chat.set_volume(chat_id, new_volume)
-            await callback_query.answer(message)
-            
-        elif data == "music_volume_down":
-            current_volume = voice_chat.active_calls.get(chat_id, {}).get("volume", 100)
-            new_volume = max(current_volume - 10, 0)
-            success, message = await voice_chat.set_volume(chat_id, new_volume)
-            await callback_query.answer(message)
-            
-        elif data == "music_queue":
-            queue = queue_manager.get_queue(chat_id)
-            if not queue:
-                await callback_query.answer("Queue is empty")
-                return
-            
-            # Show first page of queue
-            await show_queue_page(client, chat_id, message_id, queue, 0)
-            await callback_query.answer("Queue loaded")
-            
-        elif data.startswith("music_queue_page_"):
-            # Handle queue pagination
-            page = int(data.split("_")[-1])
+
+        # Resolve the per-chat call state once here instead of each branch
+        # re-walking active_calls with its own .get chain
+        call_state = voice_chat.active_calls.get(chat_id, {})
+
+        # O(1) routing: exact actions go through the dispatch table, the
+        # only parameterized action (queue pagination) is handled below
+        handler = _MUSIC_HANDLERS.get(data)
+        if handler is not None:
+            await handler(client, callback_query, chat_id, message_id,
+                          voice_chat, queue_manager, call_state)
+        elif data.startswith(_QP_PREFIX):
+            # Handle queue pagination; answer first so the spinner clears
+            # while the edit is in flight, and let cache_time suppress
+            # duplicate clicks on the same page client-side
+            page = int(data[_QP_LEN:])
+            ack = asyncio.create_task(callback_query.answer(f"Page {page+1}", cache_time=2))
             queue = queue_manager.get_queue(chat_id)
             await show_queue_page(client, chat_id, message_id, queue, page)
-            await callback_query.answer(f"Page {page+1}")
-            
-        elif data == "music_back_to_player":
-            # Return to player view
-            current_track = voice_chat.active_calls.get(chat_id, {}).get("current_track")
-            if current_track:
-                is_paused = False  # We would need to track this state
-                await update_now_playing(client, chat_id, message_id, current_track, is_paused)
-            else:
-                await callback_query.message.edit_text(
-                    "No track currently playing",
-                    reply_markup=get_main_keyboard()
-                )
-            await callback_query.answer("Back to player")
-            
-        elif data == "music_refresh":
-            # Refresh the player UI
-            current_track = voice_chat.active_calls.get(chat_id, {}).get("current_track")
-            if current_track:
-                is_paused = False  # We would need to track this state
-                await update_now_playing(client, chat_id, message_id, current_track, is_paused)
-                await callback_query.answer("Player refreshed")
-            else:
-                await callback_query.message.edit_text(
-                    "No track currently playing",
-                    reply_markup=get_main_keyboard()
-                )
-                await callback_query.answer("No active playback")
-                
-        elif data == "music_lyrics":
-            # Get lyrics for the current track
-            current_track = voice_chat.active_calls.get(chat_id, {}).get("current_track")
-            if not current_track:
-                await callback_query.answer("No track currently playing")
-                return
-            
-            # Get instances from bot
-            lyrics_client = getattr(client, "lyrics_client", None)
-            if not lyrics_client:
-                logger.error("Lyrics client not initialized")
-                await callback_query.answer("Lyrics functionality is not available")
-                return
-            
-            await callback_query.answer("Searching for lyrics...")
-            
-            # Get song name and artist
-            song_name = current_track["name"]
-            artist_name = current_track["artists"]
-            
-            # Get lyrics
-            lyrics_data = await lyrics_client.get_lyrics_by_search(song_name, artist_name)
-            
-            # Create back button
-            back_button = InlineKeyboardMarkup([
-                [InlineKeyboardButton(BACK_BUTTON, callback_data="music_back_to_player")]
-            ])
-            
-            # Send enhanced lyrics display
-            await send_lyrics_with_visual(client, chat_id, lyrics_data, current_track, back_button)
-        
+            await ack
         else:
-            await callback_query.answer("Unknown action")
+            await callback_query.answer("Unknown action", cache_time=2)
+
+
+async def _music_pause(client, callback_query, chat_id, message_id, voice_chat, queue_manager, call_state):
+    # Fire the callback ACK concurrently with the voice-chat RPC so the
+    # client spinner clears while the slower call is still in flight
+    ack = asyncio.create_task(callback_query.answer("Pausing..."))
+    success, message = await voice_chat.pause(chat_id)
+    if success:
+        # The UI edit and the ACK are independent round trips; overlap them
+        await asyncio.gather(
+            update_player_controls(client, chat_id, message_id, is_paused=True),
+            ack
+        )
+    else:
+        await ack
+
+
+async def _music_resume(client, callback_query, chat_id, message_id, voice_chat, queue_manager, call_state):
+    ack = asyncio.create_task(callback_query.answer("Resuming..."))
+    success, message = await voice_chat.resume(chat_id)
+    if success:
+        await asyncio.gather(
+            update_player_controls(client, chat_id, message_id, is_paused=False),
+            ack
+        )
+    else:
+        await ack
+
+
+async def _music_skip(client, callback_query, chat_id, message_id, voice_chat, queue_manager, call_state):
+    ack = asyncio.create_task(callback_query.answer("Skipping..."))
+    success, message = await voice_chat.skip(chat_id)
+    if success:
+        current_track = call_state.get("current_track")
+        await asyncio.gather(
+            update_now_playing(client, chat_id, message_id, current_track),
+            ack
+        )
+    else:
+        await ack
+
+
+async def _music_stop(client, callback_query, chat_id, message_id, voice_chat, queue_manager, call_state):
+    ack = asyncio.create_task(callback_query.answer("Stopping..."))
+    success, message = await voice_chat.leave_voice_chat(chat_id)
+    if success:
+        _last_render.pop((chat_id, message_id), None)
+        await asyncio.gather(
+            callback_query.message.edit_text(
+                "⏹️ Playback stopped and left voice chat",
+                reply_markup=None
+            ),
+            ack
+        )
+    else:
+        await ack
+
+
+# LRU cache of lyrics payloads keyed by (song, artist); a remote lyrics
+# lookup costs hundreds of milliseconds, a repeat of a popular song none
+_LYRICS_CACHE_MAX = 256
+_lyrics_cache = OrderedDict()
+
+# Debounce state: rapid Vol+/Vol-/Refresh presses are acknowledged
+# immediately but coalesced into one API call per (chat, message) burst,
+# which avoids Telegram's per-chat throttling kicking in
+_DEBOUNCE_DELAY = 0.3
+_pending_volume = {}    # (chat_id, message_id) -> target volume
+_volume_handles = {}    # (chat_id, message_id) -> asyncio.TimerHandle
+_refresh_handles = {}   # (chat_id, message_id) -> asyncio.TimerHandle
+
+# Floor between full refresh renders per player message: sustained button
+# mashing beats the debounce window, so flushes are additionally spaced
+# out to cap worst-case render/edit QPS
+_REFRESH_MIN_INTERVAL = 1.5
+_last_flush = {}        # (chat_id, message_id) -> time.monotonic() of last render
+
+
+async def _bump_volume(callback_query, chat_id, message_id, voice_chat, call_state, delta):
+    """Acknowledge a volume press and schedule one debounced set_volume."""
+    key = (chat_id, message_id)
+
+    # Accumulate on top of the pending target so spamming the button
+    # still lands on the value the user aimed for
+    current = _pending_volume.get(key)
+    if current is None:
+        current = call_state.get("volume", 100)
+    new_volume = max(0, min(current + delta, 200))
+    _pending_volume[key] = new_volume
+
+    await callback_query.answer(f"Volume: {new_volume}%")
+
+    handle = _volume_handles.pop(key, None)
+    if handle is not None:
+        handle.cancel()
+    loop = asyncio.get_running_loop()
+    _volume_handles[key] = loop.call_later(
+        _DEBOUNCE_DELAY,
+        lambda: asyncio.create_task(_flush_volume(key, voice_chat))
+    )
+
+
+async def _flush_volume(key, voice_chat):
+    """Apply the final pending volume for a burst of presses."""
+    _volume_handles.pop(key, None)
+    volume = _pending_volume.pop(key, None)
+    if volume is None:
+        return
+    try:
+        await voice_chat.set_volume(key[0], volume)
+    except Exception as e:
+        logger.error(f"Error applying debounced volume: {e}")
+
+
+async def _music_volume_up(client, callback_query, chat_id, message_id, voice_chat, queue_manager, call_state):
+    await _bump_volume(callback_query, chat_id, message_id, voice_chat, call_state, 10)
+
+
+async def _music_volume_down(client, callback_query, chat_id, message_id, voice_chat, queue_manager, call_state):
+    await _bump_volume(callback_query, chat_id, message_id, voice_chat, call_state, -10)
+
+
+async def _music_queue(client, callback_query, chat_id, message_id, voice_chat, queue_manager, call_state):
+    queue = queue_manager.get_queue(chat_id)
+    if not queue:
+        await callback_query.answer("Queue is empty", cache_time=2)
+        return
+
+    # Answer before the edit so the spinner clears immediately
+    ack = asyncio.create_task(callback_query.answer("Queue loaded"))
+    await show_queue_page(client, chat_id, message_id, queue, 0)
+    await ack
+
+
+async def _music_back_to_player(client, callback_query, chat_id, message_id, voice_chat, queue_manager, call_state):
+    # Return to player view; answer first, then edit
+    ack = asyncio.create_task(callback_query.answer("Back to player"))
+    current_track = call_state.get("current_track")
+    if current_track:
+        is_paused = call_state.get("is_paused", False)
+        await update_now_playing(client, chat_id, message_id, current_track, is_paused)
+    else:
+        await callback_query.message.edit_text(
+            "No track currently playing",
+            reply_markup=get_main_keyboard()
+        )
+    await ack
+
+
+async def _music_refresh(client, callback_query, chat_id, message_id, voice_chat, queue_manager, call_state):
+    # Refresh the player UI
+    current_track = call_state.get("current_track")
+    if not current_track:
+        await callback_query.message.edit_text(
+            "No track currently playing",
+            reply_markup=get_main_keyboard()
+        )
+        await callback_query.answer("No active playback", cache_time=2)
+        return
+
+    # Acknowledge right away; the actual edit is debounced so a burst of
+    # refresh presses produces a single Telegram call
+    await callback_query.answer("Player refreshed")
+
+    key = (chat_id, message_id)
+    handle = _refresh_handles.pop(key, None)
+    if handle is not None:
+        handle.cancel()
+    loop = asyncio.get_running_loop()
+    _refresh_handles[key] = loop.call_later(
+        _DEBOUNCE_DELAY,
+        lambda: asyncio.create_task(_flush_refresh(client, key, voice_chat))
+    )
+
+
+async def _flush_refresh(client, key, voice_chat):
+    """Run the debounced player refresh for a burst of presses."""
+    _refresh_handles.pop(key, None)
+
+    # Respect the per-message floor: under sustained clicking, push the
+    # flush out to the next allowed slot instead of rendering every burst
+    now = time.monotonic()
+    remaining = _REFRESH_MIN_INTERVAL - (now - _last_flush.get(key, 0.0))
+    if remaining > 0:
+        loop = asyncio.get_running_loop()
+        _refresh_handles[key] = loop.call_later(
+            remaining,
+            lambda: asyncio.create_task(_flush_refresh(client, key, voice_chat))
+        )
+        return
+    _last_flush[key] = now
+
+    chat_id, message_id = key
+    call_state = voice_chat.active_calls.get(chat_id, {})
+    current_track = call_state.get("current_track")
+    if not current_track:
+        return
+    is_paused = call_state.get("is_paused", False)
+    try:
+        await update_now_playing(client, chat_id, message_id, current_track, is_paused)
+    except Exception as e:
+        logger.error(f"Error refreshing player: {e}")
+
+
+async def _music_lyrics(client, callback_query, chat_id, message_id, voice_chat, queue_manager, call_state):
+    # Get lyrics for the current track
+    current_track = call_state.get("current_track")
+    if not current_track:
+        await callback_query.answer("No track currently playing")
+        return
+
+    # Get instances from bot
+    lyrics_client = getattr(client, "lyrics_client", None)
+    if not lyrics_client:
+        logger.error("Lyrics client not initialized")
+        await callback_query.answer("Lyrics functionality is not available")
+        return
+
+    # Acknowledge concurrently with the lyrics lookup; the two round trips
+    # overlap instead of serializing
+    ack = asyncio.create_task(callback_query.answer("Searching for lyrics..."))
+
+    # Get song name and artist
+    song_name = current_track["name"]
+    artist_name = current_track["artists"]
+
+    # Serve repeat lookups from the LRU cache instead of re-hitting the
+    # lyrics API; failed lookups are never cached so they can retry
+    cache_key = (song_name.casefold(), artist_name.casefold())
+    lyrics_data = _lyrics_cache.get(cache_key)
+    if lyrics_data is not None:
+        _lyrics_cache.move_to_end(cache_key)
+    else:
+        lyrics_data = await lyrics_client.get_lyrics_by_search(song_name, artist_name)
+        if lyrics_data is not None:
+            _lyrics_cache[cache_key] = lyrics_data
+            if len(_lyrics_cache) > _LYRICS_CACHE_MAX:
+                _lyrics_cache.popitem(last=False)
+    await ack
+
+    # Send enhanced lyrics display
+    await send_lyrics_with_visual(client, chat_id, lyrics_data, current_track, _LYRICS_BACK_MARKUP)
+
+
+async def _music_play(client, callback_query, chat_id, message_id, voice_chat, queue_manager, call_state):
+    # The main keyboard offers Play/Search, but both need a query the
+    # button can't carry — point the user at the command instead of
+    # leaving the callback unanswered
+    await callback_query.answer("Use /play [song name] to play a song.", show_alert=True)
+
+
+async def _music_search(client, callback_query, chat_id, message_id, voice_chat, queue_manager, call_state):
+    await callback_query.answer("Use /search [song name] to find songs.", show_alert=True)
+
+
+# Built once; every music callback routes through a single dict lookup
+_MUSIC_HANDLERS = {
+    "music_play": _music_play,
+    "music_search": _music_search,
+    "music_pause": _music_pause,
+    "music_resume": _music_resume,
+    "music_skip": _music_skip,
+    "music_stop": _music_stop,
+    "music_volume_up": _music_volume_up,
+    "music_volume_down": _music_volume_down,
+    "music_queue": _music_queue,
+    "music_back_to_player": _music_back_to_player,
+    "music_refresh": _music_refresh,
+    "music_lyrics": _music_lyrics,
+}
+
+# Exact action names accepted by the music callback filter
+_MUSIC_ACTIONS = frozenset(_MUSIC_HANDLERS)
+
+
+async def _quiz_new(client, callback_query, chat_id, user_id, quiz_manager, active_quiz):
+    if active_quiz and active_quiz.is_active():
+        await callback_query.answer("A quiz is already in progress!")
+        return
+
+    # Create a new quiz with default settings
+    await callback_query.answer("Creating new quiz...")
+
+    # Get user info for username mapping (cached per chat)
+    usernames = await _get_usernames_cached(
+        client, chat_id, callback_query.message.chat.type
+    )
+
+    # Create new quiz
+    new_quiz = await quiz_manager.create_quiz(
+        chat_id=chat_id,
+        creator_id=user_id,
+        num_questions=5  # Default number of questions
+    )
+
+    if new_quiz:
+        # Send first question
+        await new_quiz.send_question(client, chat_id, usernames)
+        await callback_query.message.delete()
+    else:
+        await callback_query.answer("Failed to create a new quiz. Please try again later.")
+
+
+async def _quiz_answer(client, callback_query, chat_id, user_id, quiz_manager, active_quiz, suffix):
+    if not active_quiz:
+        await callback_query.answer("No active quiz in this chat.")
+        return
+
+    # Validate the pre-sliced suffix up front; a cheap isdigit check avoids
+    # building an exception and traceback for malformed callback data
+    if not suffix.isdigit():
+        await callback_query.answer("Invalid option.")
+        return
+    option_index = int(suffix)
+
+    # Resolve the answerer's name from the callback itself; rendering
+    # results only needs users who interacted, so no roster walk happens
+    # on this path at all
+    from_user = callback_query.from_user
+    usernames = _quiz_usernames.setdefault(chat_id, {})
+    usernames[user_id] = from_user.username or from_user.first_name
+
+    # Record the user's answer
+    answer_added, is_correct, points = active_quiz.add_answer(user_id, option_index)
+
+    if not answer_added:
+        await callback_query.answer("You already answered this question!")
+        return
+
+    # Inform the user about their answer
+    if is_correct:
+        await callback_query.answer(f"Correct! +{points} points")
+    else:
+        await callback_query.answer("Incorrect!")
+
+    # Check if all users have answered or time is up
+    # If this is the last person to answer, move to next question
+    users_answered = len(active_quiz.get_current_question().answered_by)
+
+    # Move to next question if we've hit the threshold
+    # For simplicity, we'll continue after a certain number of answers or a
+    # fixed time delay. The count comes from the cached roster (populated
+    # when the quiz started), not from who has answered so far — the
+    # per-answer name map only tracks interactions for rendering results
+    roster = await _get_usernames_cached(
+        client, chat_id, callback_query.message.chat.type
+    )
+    chat_participants = len(roster) or 5
+    answer_threshold = min(chat_participants, 5)  # Either all users or max 5
+
+    if users_answered >= answer_threshold:
+        # Show correct answer
+        correct_answer = active_quiz.get_current_question().get_correct_answer()
+        correct_details = active_quiz.get_current_question().get_correct_answer_details()
+
+        await client.send_message(
+            chat_id=chat_id,
+            text=f"⏱ Time's up!\n\n✅ The correct answer is: **{correct_answer}**\n{correct_details}"
+        )
+
+        # Delay for a moment to let users see the correct answer
+        await asyncio.sleep(3)
+
+        # Move to next question
+        next_question = active_quiz.next_question()
+
+        if next_question:
+            # Send next question
+            await active_quiz.send_question(client, chat_id, usernames)
+        else:
+            # End of quiz, show results
+            await active_quiz.send_results(client, chat_id, usernames)
+            quiz_manager.end_quiz(chat_id)
+            _chat_usernames.pop(chat_id, None)
+            _quiz_usernames.pop(chat_id, None)
+
+
+async def _quiz_end(client, callback_query, chat_id, user_id, quiz_manager, active_quiz):
+    if not active_quiz:
+        await callback_query.answer("No active quiz to end.")
+        return
+
+    # Get user info for username mapping (cached per chat), overlaid with
+    # the names collected from actual answers
+    usernames = dict(await _get_usernames_cached(
+        client, chat_id, callback_query.message.chat.type
+    ))
+    usernames.update(_quiz_usernames.get(chat_id, {}))
+
+    # Show results and end quiz
+    await active_quiz.send_results(client, chat_id, usernames)
+    quiz_manager.end_quiz(chat_id)
+    _chat_usernames.pop(chat_id, None)
+    _quiz_usernames.pop(chat_id, None)
+    await callback_query.answer("Quiz ended.")
+
+    # Delete the callback message
+    try:
+        await callback_query.message.delete()
+    except Exception as e:
+        logger.error(f"Failed to delete message: {e}")
+
+
+# Built once; every quiz callback routes through a single dict lookup
+_QUIZ_HANDLERS = {
+    "quiz_new": _quiz_new,
+    "quiz_end": _quiz_end,
+}
+
+
+# The back row never varies, so build it once instead of per render
+_QUEUE_BACK_ROW = [InlineKeyboardButton(BACK_BUTTON, callback_data="music_back_to_player")]
+
+# Fixed cancel button reused by every search-results keyboard
+_CANCEL_SEARCH_BTN = InlineKeyboardButton("❌ Cancel", callback_data="cancel_search")
+
+# Back-to-player markup shared by every lyrics reply
+_LYRICS_BACK_MARKUP = InlineKeyboardMarkup([_QUEUE_BACK_ROW])
+
+
+# Arrow buttons are immutable per target page; memoizing them avoids
+# rebuilding the same objects every time a queue page is rendered
+@lru_cache(maxsize=256)
+def _prev_btn(page):
+    return InlineKeyboardButton("⬅️", callback_data=f"music_queue_page_{page}")
+
+
+@lru_cache(maxsize=256)
+def _next_btn(page):
+    return InlineKeyboardButton("➡️", callback_data=f"music_queue_page_{page}")
+
+
+@lru_cache(maxsize=256)
+def _pagination_row(page, total_pages):
+    """Build (and memoize) the full pagination row for one page position."""
+    row = []
+    if page > 0:
+        row.append(_prev_btn(page - 1))
+    row.append(
+        InlineKeyboardButton(f"{page+1}/{total_pages}", callback_data="music_refresh")
+    )
+    if page < total_pages - 1:
+        row.append(_next_btn(page + 1))
+    return tuple(row)
+
+
+def _build_queue_page_markup(page, total_pages):
+    """Build the pagination + back keyboard for a queue page in one pass."""
+    buttons = []
+    if total_pages > 1:
+        buttons.append(list(_pagination_row(page, total_pages)))
+    buttons.append(_QUEUE_BACK_ROW)
+    return InlineKeyboardMarkup(buttons)
+
+
+def _build_queue_page_text(queue, page, total_pages, start_idx, end_idx):
+    """Build one page of queue text in a single join instead of += growth."""
+    total = len(queue)
+    lines = ["🎵 **Music Queue**\n"]
+    lines.extend(
+        f"{i}. **{track['name'][:40]}** - {track['artists'][:20]}"
+        for i, track in enumerate(queue[start_idx:end_idx], start=start_idx + 1)
+    )
+    lines.append(f"\nPage {page+1}/{total_pages} | Total: {total} tracks")
+    return "\n".join(lines)
+
 
 async def show_queue_page(client, chat_id, message_id, queue, page):
     """Show a page of the queue with visual elements."""
-    from .image_ui import ImageUI
     
     items_per_page = 5
     total_pages = (len(queue) + items_per_page - 1) // items_per_page
@@ -333,9 +680,7 @@ async def show_queue_page(client, chat_id, message_id, queue, page):
             chat_id=chat_id,
             message_id=message_id,
             text="Queue is empty",
-            reply_markup=InlineKeyboardMarkup([[
-                InlineKeyboardButton(BACK_BUTTON, callback_data="music_back_to_player")
-            ]])
+            reply_markup=InlineKeyboardMarkup([_QUEUE_BACK_ROW])
         )
         return
     
@@ -343,11 +688,12 @@ async def show_queue_page(client, chat_id, message_id, queue, page):
     end_idx = min(start_idx + items_per_page, len(queue))
     
     # Get image_ui instance
-    image_ui = getattr(client, "image_ui", None)
-    if not image_ui:
-        image_ui = ImageUI()
-        client.image_ui = image_ui
+    image_ui = client.image_ui
     
+    # Build the page once; both the image and text paths share it
+    text = _build_queue_page_text(queue, page, total_pages, start_idx, end_idx)
+    markup = _build_queue_page_markup(page, total_pages)
+
     # Try to create a visual representation of the queue
     if hasattr(image_ui, 'create_playlist_image'):
         try:
@@ -356,39 +702,7 @@ async def show_queue_page(client, chat_id, message_id, queue, page):
                 track_count=len(queue),
                 created_by=None
             )
-            
-            # Prepare caption text
-            text = "🎵 **Music Queue**\n\n"
-            for i, track in enumerate(queue[start_idx:end_idx], start=start_idx + 1):
-                text += f"{i}. **{track['name']}** - {track['artists']}\n"
-            
-            text += f"\nPage {page+1}/{total_pages} | Total: {len(queue)} tracks"
-            
-            # Create pagination buttons
-            buttons = []
-            if total_pages > 1:
-                pagination_row = []
-                if page > 0:
-                    pagination_row.append(
-                        InlineKeyboardButton("⬅️", callback_data=f"music_queue_page_{page-1}")
-                    )
-                
-                pagination_row.append(
-                    InlineKeyboardButton(f"{page+1}/{total_pages}", callback_data="music_refresh")
-                )
-                
-                if page < total_pages - 1:
-                    pagination_row.append(
-                        InlineKeyboardButton("➡️", callback_data=f"music_queue_page_{page+1}")
-                    )
-                
-                buttons.append(pagination_row)
-            
-            # Add back button
-            buttons.append([
-                InlineKeyboardButton(BACK_BUTTON, callback_data="music_back_to_player")
-            ])
-            
+
             if image_path:
                 # Edit message with image
                 try:
@@ -399,58 +713,47 @@ async def show_queue_page(client, chat_id, message_id, queue, page):
                             media=image_path,
                             caption=text
                         ),
-                        reply_markup=InlineKeyboardMarkup(buttons)
+                        reply_markup=markup
                     )
                     return
                 except Exception as e:
                     logger.error(f"Error updating queue with image: {e}")
                     # Fall back to text-only update below
-            
+
         except Exception as e:
             logger.error(f"Failed to create playlist image: {e}")
             # Fall back to text-only update
-    
+
     # Text-only fallback
-    text = "🎵 **Music Queue**\n\n"
-    for i, track in enumerate(queue[start_idx:end_idx], start=start_idx + 1):
-        text += f"{i}. **{track['name']}** - {track['artists']}\n"
-    
-    text += f"\nPage {page+1}/{total_pages} | Total: {len(queue)} tracks"
-    
-    # Create pagination buttons
-    buttons = []
-    if total_pages > 1:
-        pagination_row = []
-        if page > 0:
-            pagination_row.append(
-                InlineKeyboardButton("⬅️", callback_data=f"music_queue_page_{page-1}")
-            )
-        
-        pagination_row.append(
-            InlineKeyboardButton(f"{page+1}/{total_pages}", callback_data="music_refresh")
-        )
-        
-        if page < total_pages - 1:
-            pagination_row.append(
-                InlineKeyboardButton("➡️", callback_data=f"music_queue_page_{page+1}")
-            )
-        
-        buttons.append(pagination_row)
-    
-    # Add back button
-    buttons.append([
-        InlineKeyboardButton(BACK_BUTTON, callback_data="music_back_to_player")
-    ])
-    
     await client.edit_message_text(
         chat_id=chat_id,
         message_id=message_id,
         text=text,
-        reply_markup=InlineKeyboardMarkup(buttons)
+        reply_markup=markup
     )
 
+# Keyboard markups are immutable once built, so each distinct player
+# keyboard (paused/playing, with or without the configured owner/updates
+# rows) is constructed once and reused for every subsequent callback
+_PLAYER_CONTROLS_CACHE = {}
+
+
 def get_player_controls(is_paused=False, config=None):
     """Get inline keyboard markup for player controls."""
+    owner_url = config.OWNER_URL if config and config.OWNER_USERNAME and config.OWNER_URL else None
+    updates_url = (config.UPDATES_CHANNEL_URL
+                   if config and config.UPDATES_CHANNEL and config.UPDATES_CHANNEL_URL else None)
+    cache_key = (is_paused, owner_url, updates_url)
+
+    markup = _PLAYER_CONTROLS_CACHE.get(cache_key)
+    if markup is None:
+        markup = _build_player_controls(is_paused, owner_url, updates_url)
+        _PLAYER_CONTROLS_CACHE[cache_key] = markup
+    return markup
+
+
+def _build_player_controls(is_paused, owner_url, updates_url):
+    """Construct the player-controls markup for one cache key."""
     play_pause_button = InlineKeyboardButton(
         RESUME_BUTTON if is_paused else PAUSE_BUTTON,
         callback_data="music_resume" if is_paused else "music_pause"
@@ -472,79 +775,117 @@ def get_player_controls(is_paused=False, config=None):
     
     # Add owner and updates buttons if configured
     owner_updates_row = []
-    if config:
-        if config.OWNER_USERNAME and config.OWNER_URL:
-            owner_updates_row.append(
-                InlineKeyboardButton("👤 OWNER", url=config.OWNER_URL)
-            )
-        if config.UPDATES_CHANNEL and config.UPDATES_CHANNEL_URL:
-            owner_updates_row.append(
-                InlineKeyboardButton("📢 UPDATES", url=config.UPDATES_CHANNEL_URL)
-            )
-    
+    if owner_url:
+        owner_updates_row.append(InlineKeyboardButton("👤 OWNER", url=owner_url))
+    if updates_url:
+        owner_updates_row.append(InlineKeyboardButton("📢 UPDATES", url=updates_url))
+
     if owner_updates_row:
         buttons.append(owner_updates_row)
-    
+
     return InlineKeyboardMarkup(buttons)
 
+# The main keyboard never varies, so build it once at import
+_MAIN_KEYBOARD = InlineKeyboardMarkup([
+    [InlineKeyboardButton(PLAY_BUTTON, callback_data="music_play")],
+    [InlineKeyboardButton(SEARCH_BUTTON, callback_data="music_search")],
+    [InlineKeyboardButton(QUEUE_BUTTON, callback_data="music_queue")],
+    [InlineKeyboardButton("🎮 Music Quiz", callback_data="quiz_new")]
+])
+
+
 def get_main_keyboard():
     """Get main inline keyboard with basic options."""
-    return InlineKeyboardMarkup([
-        [InlineKeyboardButton(PLAY_BUTTON, callback_data="music_play")],
-        [InlineKeyboardButton(SEARCH_BUTTON, callback_data="music_search")],
-        [InlineKeyboardButton(QUEUE_BUTTON, callback_data="music_queue")],
-        [InlineKeyboardButton("🎮 Music Quiz", callback_data="quiz_new")]
-    ])
+    return _MAIN_KEYBOARD
+
+# Rendered now-playing media keyed by (track_id, 5%-progress bucket).
+# The value is the Telegram file_id captured after the first upload, so
+# repeat renders of the same bucket skip both the PIL render and the
+# upload; for paused tracks the hit rate is near total
+_NP_MEDIA_MAX = 512
+_np_media_cache = OrderedDict()
+
+
+async def _get_now_playing_media(image_ui, track, progress):
+    """Return (media, cache_key) — a cached file_id or a fresh image path."""
+    bucket = int(progress * 20)
+    key = (track.get("id"), bucket)
+    file_id = _np_media_cache.get(key)
+    if file_id is not None:
+        _np_media_cache.move_to_end(key)
+        return file_id, key
+    path = await image_ui.create_now_playing_image(track, bucket / 20)
+    return path, key
+
+
+def _remember_np_file_id(key, sent_message):
+    """Capture the uploaded photo's file_id for reuse on later renders."""
+    photo = getattr(sent_message, "photo", None)
+    file_id = getattr(photo, "file_id", None)
+    if not file_id:
+        return
+    _np_media_cache[key] = file_id
+    if len(_np_media_cache) > _NP_MEDIA_MAX:
+        _np_media_cache.popitem(last=False)
+
+
+# Fingerprint of the last render pushed per (chat_id, message_id); lets
+# refresh skip the whole edit round trip when nothing changed, instead of
+# paying an API call just to get "message is not modified" back
+_last_render = {}
+
 
 async def update_now_playing(client, chat_id, message_id, track, is_paused=False):
     """Update the now playing message with track info and controls."""
-    from .helpers import format_duration
-    from .image_ui import ImageUI
-    
+
     # Get instances from client
-    image_ui = getattr(client, "image_ui", None)
-    if not image_ui:
-        image_ui = ImageUI()
-        client.image_ui = image_ui
+    image_ui = client.image_ui
     
     # Get config from client
     config = getattr(client, "config", None)
     
-    # Calculate progress (in a real implementation, this would come from the voice chat)
+    # Calculate progress from the voice chat's monotonic start time;
+    # monotonic is immune to wall-clock (NTP) jumps
     progress = 0.0
     voice_chat = getattr(client, "voice_chat", None)
-    if voice_chat and chat_id in voice_chat.active_calls:
-        start_time = voice_chat.active_calls[chat_id].get("start_time", 0)
-        duration = track.get("duration_ms", 0) / 1000
-        if start_time > 0 and duration > 0:
-            elapsed = time.time() - start_time
-            progress = min(elapsed / duration, 1.0)
-    
-    # Generate the now playing image
-    image_path = await image_ui.create_now_playing_image(track, progress)
-    
-    text = f"🎵 **Now Playing**\n\n"
-    text += f"**{track['name']}**\n"
-    text += f"👤 {track['artists']}\n"
-    text += f"💽 {track['album']}\n"
-    text += f"⏱️ {format_duration(track['duration_ms'])}\n"
-    
-    # Add link to Spotify
-    if track.get('external_url'):
-        text += f"\n[Listen on Spotify]({track['external_url']})"
-    
-    if image_path:
+    call = voice_chat.active_calls.get(chat_id) if voice_chat else None
+    if call:
+        start_time = call.get("start_time_mono", 0)
+        duration_ms = track.get("duration_ms", 0)
+        if start_time and duration_ms:
+            progress = min((time.monotonic() - start_time) * 1000 / duration_ms, 1.0)
+    
+    # Reuse a cached upload when possible, else render a fresh image
+    media, media_key = await _get_now_playing_media(image_ui, track, progress)
+
+    text = _render_now_playing(track)
+
+    # Skip the edit entirely when this exact render is already on screen;
+    # if only the paused state moved, push the much lighter markup-only
+    # edit instead of re-sending the whole text/media
+    render_key = (chat_id, message_id)
+    fingerprint = hash((text, media_key))
+    prev = _last_render.get(render_key)
+    if prev is not None and prev[0] == fingerprint:
+        if prev[1] != is_paused:
+            await update_player_controls(client, chat_id, message_id, is_paused)
+        return
+    _last_render[render_key] = (fingerprint, is_paused)
+
+    if media:
         # Send/update with the generated image
         try:
-            await client.edit_message_media(
+            sent = await client.edit_message_media(
                 chat_id=chat_id,
                 message_id=message_id,
                 media=types.InputMediaPhoto(
-                    media=image_path,
+                    media=media,
                     caption=text
                 ),
                 reply_markup=get_player_controls(is_paused, config)
             )
+            if media_key not in _np_media_cache:
+                _remember_np_file_id(media_key, sent)
         except Exception as e:
             logger.error(f"Error updating message with image: {e}")
             # Fallback to text-only update
@@ -569,7 +910,13 @@ async def update_player_controls(client, chat_id, message_id, is_paused=False):
     """Update just the player controls without changing the message text."""
     # Get config from client
     config = getattr(client, "config", None)
-    
+
+    # Keep the remembered paused state in step so a later full refresh of
+    # the same render doesn't push a redundant markup edit
+    prev = _last_render.get((chat_id, message_id))
+    if prev is not None:
+        _last_render[(chat_id, message_id)] = (prev[0], is_paused)
+
     await client.edit_message_reply_markup(
         chat_id=chat_id,
         message_id=message_id,
@@ -578,42 +925,32 @@ async def update_player_controls(client, chat_id, message_id, is_paused=False):
 
 async def send_now_playing(client, message, track, is_paused=False):
     """Send a new now playing message with track info and controls."""
-    from .helpers import format_duration
-    from .image_ui import ImageUI
     
     # Get instances from client
-    image_ui = getattr(client, "image_ui", None)
-    if not image_ui:
-        image_ui = ImageUI()
-        client.image_ui = image_ui
+    image_ui = client.image_ui
     
     # Get config from client
     config = getattr(client, "config", None)
     
     # Calculate initial progress
     progress = 0.0
-    
-    # Generate the now playing image
-    image_path = await image_ui.create_now_playing_image(track, progress)
-    
-    text = f"🎵 **Now Playing**\n\n"
-    text += f"**{track['name']}**\n"
-    text += f"👤 {track['artists']}\n"
-    text += f"💽 {track['album']}\n"
-    text += f"⏱️ {format_duration(track['duration_ms'])}\n"
-    
-    # Add link to Spotify
-    if track.get('external_url'):
-        text += f"\n[Listen on Spotify]({track['external_url']})"
-    
-    if image_path:
+
+    # Reuse a cached upload when possible, else render a fresh image
+    media, media_key = await _get_now_playing_media(image_ui, track, progress)
+
+    text = _render_now_playing(track)
+
+    if media:
         # Send with the generated image
         try:
-            return await message.reply_photo(
-                photo=image_path,
+            sent = await message.reply_photo(
+                photo=media,
                 caption=text,
                 reply_markup=get_player_controls(is_paused, config)
             )
+            if media_key not in _np_media_cache:
+                _remember_np_file_id(media_key, sent)
+            return sent
         except Exception as e:
             logger.error(f"Error sending message with image: {e}")
             # Fallback to text-only
@@ -630,7 +967,6 @@ async def send_now_playing(client, message, track, is_paused=False):
 
 async def send_search_results(message, results):
     """Send search results as an inline keyboard with visual elements."""
-    from .image_ui import ImageUI
     
     if not results:
         await message.reply("No results found.")
@@ -640,38 +976,38 @@ async def send_search_results(message, results):
     client = message._client
     
     # Get image_ui instance
-    image_ui = getattr(client, "image_ui", None)
-    if not image_ui:
-        image_ui = ImageUI()
-        client.image_ui = image_ui
+    image_ui = client.image_ui
     
     text = "🔍 **Search Results**\n\nSelect a track to play:"
-    
-    buttons = []
-    for i, track in enumerate(results[:8]):  # Limit to 8 results
-        buttons.append([
-            InlineKeyboardButton(
-                f"{i+1}. {track['name']} - {track['artists']}",
-                callback_data=f"play_{track['id']}"
-            )
-        ])
-    
-    buttons.append([InlineKeyboardButton("❌ Cancel", callback_data="cancel_search")])
+
+    # One-shot row construction; limit to 8 results. Button text is
+    # truncated to stay under Telegram's ~64-byte button-text limit
+    buttons = [
+        [InlineKeyboardButton(
+            f"{i+1}. {track['name'][:40]} - {track['artists'][:20]}",
+            callback_data=f"play_{track['id']}"
+        )]
+        for i, track in enumerate(results[:8])
+    ]
+    buttons.append([_CANCEL_SEARCH_BTN])
     
     # Try to create a visual representation of the top result
     try:
-        if results and hasattr(image_ui, 'create_now_playing_image'):
+        # results is already known non-empty from the guard above
+        if hasattr(image_ui, 'create_now_playing_image'):
             top_track = results[0]
             
             # Generate image for the top result
             image_path = await image_ui.create_now_playing_image(top_track, 0.0)
             
             if image_path:
-                # Enhanced caption for the image
-                caption = "🔍 **Search Results**\n\n"
-                caption += f"**Top Result: {top_track['name']}**\n"
-                caption += f"👤 {top_track['artists']}\n\n"
-                caption += "Select a track to play:"
+                # Enhanced caption for the image, built in one pass
+                caption = (
+                    "🔍 **Search Results**\n\n"
+                    f"**Top Result: {top_track['name']}**\n"
+                    f"👤 {top_track['artists']}\n\n"
+                    "Select a track to play:"
+                )
                 
                 # Send with image
                 await message.reply_photo(
@@ -692,7 +1028,6 @@ async def send_search_results(message, results):
 
 async def send_lyrics_with_visual(client, chat_id, lyrics_data, track_info, reply_markup=None):
     """Send lyrics with visual enhancement."""
-    from .image_ui import ImageUI
     
     if not lyrics_data:
         # No lyrics found
@@ -716,10 +1051,7 @@ async def send_lyrics_with_visual(client, chat_id, lyrics_data, track_info, repl
         formatted_lyrics = f"🎵 **{title}**\n👤 {artist}\n\n{lyrics}"
     
     # Get image_ui instance
-    image_ui = getattr(client, "image_ui", None)
-    if not image_ui:
-        image_ui = ImageUI()
-        client.image_ui = image_ui
+    image_ui = client.image_ui
     
     # Try to create a visual representation for the lyrics
     try:
@@ -729,17 +1061,16 @@ async def send_lyrics_with_visual(client, chat_id, lyrics_data, track_info, repl
             
             if image_path:
                 # Since lyrics can be long, we'll send a preview image first and then the full lyrics
-                preview_text = f"🎵 **Lyrics for {track_info['name']}**\n"
-                preview_text += f"👤 {track_info['artists']}\n\n"
-                
+                parts = [f"🎵 **Lyrics for {track_info['name']}**\n"
+                         f"👤 {track_info['artists']}\n"]
+
                 # Add a short preview of the lyrics (first few lines)
-                lyrics_preview = lyrics_data.get("lyrics", "")
-                if lyrics_preview:
-                    # Get first few lines
-                    preview_lines = lyrics_preview.split('\n')[:4]
-                    preview_text += '\n'.join(preview_lines)
-                    if len(preview_lines) < len(lyrics_preview.split('\n')):
-                        preview_text += "\n\n[Full lyrics below...]"
+                lyrics_lines = lyrics_data.get("lyrics", "").split('\n')
+                if lyrics_lines and lyrics_lines[0]:
+                    parts.extend(lyrics_lines[:4])
+                    if len(lyrics_lines) > 4:
+                        parts.append("\n[Full lyrics below...]")
+                preview_text = "\n".join(parts)
                 
                 # Send the image with preview
                 await client.send_photo(
@@ -768,16 +1099,28 @@ async def send_lyrics_with_visual(client, chat_id, lyrics_data, track_info, repl
         disable_web_page_preview=False
     )
 
+def _build_quiz_results_text(total_questions, correct_answers, total_participants, scorers):
+    """Build the quiz-results text in a single join."""
+    lines = [
+        "🎵 **Music Quiz Results**\n",
+        f"**Questions:** {total_questions}",
+        f"**Correct Answers:** {correct_answers}",
+        f"**Participants:** {total_participants}\n",
+    ]
+    if scorers:
+        lines.append("**Top Scorers:**")
+        for i, (username, score) in enumerate(scorers, 1):
+            medal = ["🥇", "🥈", "🥉"][i-1] if i <= 3 else f"{i}."
+            lines.append(f"{medal} {username}: {score} points")
+    return "\n".join(lines)
+
+
 async def send_quiz_results(client, chat_id, total_questions, correct_answers, 
                           total_participants, top_scorers, reply_markup=None):
     """Send quiz results with visual enhancement."""
-    from .image_ui import ImageUI
     
     # Get image_ui instance
-    image_ui = getattr(client, "image_ui", None)
-    if not image_ui:
-        image_ui = ImageUI()
-        client.image_ui = image_ui
+    image_ui = client.image_ui
     
     # Try to create a visual representation of the quiz results
     try:
@@ -792,16 +1135,9 @@ async def send_quiz_results(client, chat_id, total_questions, correct_answers,
             
             if image_path:
                 # Create caption text
-                caption = f"🎵 **Music Quiz Results**\n\n"
-                caption += f"**Questions:** {total_questions}\n"
-                caption += f"**Correct Answers:** {correct_answers}\n"
-                caption += f"**Participants:** {total_participants}\n\n"
-                
-                if top_scorers:
-                    caption += "**Top Scorers:**\n"
-                    for i, (username, score) in enumerate(top_scorers[:3], 1):
-                        medal = ["🥇", "🥈", "🥉"][i-1] if i <= 3 else f"{i}."
-                        caption += f"{medal} {username}: {score} points\n"
+                caption = _build_quiz_results_text(
+                    total_questions, correct_answers, total_participants, top_scorers[:3]
+                )
                 
                 # Send the image with caption
                 await client.send_photo(
@@ -816,17 +1152,10 @@ async def send_quiz_results(client, chat_id, total_questions, correct_answers,
         # Fall back to text-only response
     
     # Text-only fallback
-    text = f"🎵 **Music Quiz Results**\n\n"
-    text += f"**Questions:** {total_questions}\n"
-    text += f"**Correct Answers:** {correct_answers}\n"
-    text += f"**Participants:** {total_participants}\n\n"
-    
-    if top_scorers:
-        text += "**Top Scorers:**\n"
-        for i, (username, score) in enumerate(top_scorers[:5], 1):
-            medal = ["🥇", "🥈", "🥉"][i-1] if i <= 3 else f"{i}."
-            text += f"{medal} {username}: {score} points\n"
-    
+    text = _build_quiz_results_text(
+        total_questions, correct_answers, total_participants, top_scorers[:5]
+    )
+
     await client.send_message(
         chat_id=chat_id,
         text=text,
@@ -836,13 +1165,9 @@ async def send_quiz_results(client, chat_id, total_questions, correct_answers,
 async def send_quiz_question(client, message, question_number, total_questions, track_info, 
                            question_type, options, reply_markup=None):
     """Send a music quiz question with visual enhancement."""
-    from .image_ui import ImageUI
     
     # Get image_ui instance
-    image_ui = getattr(client, "image_ui", None)
-    if not image_ui:
-        image_ui = ImageUI()
-        client.image_ui = image_ui
+    image_ui = client.image_ui
     
     # Try to create a visual representation of the quiz question
     try:
@@ -55,8 +55,10 @@ class VoiceChat:
             self.active_calls[chat_id] = {
                 "started_by": user_id,
                 "start_time": time.time(),
+                "start_time_mono": time.monotonic(),
                 "current_track": None,
                 "volume": 100,
+                "is_paused": False,
                 "participants": set(),  # Set of user_ids in the voice chat
             }
             
@@ -71,8 +73,10 @@ class VoiceChat:
             self.active_calls[chat_id] = {
                 "started_by": user_id,
                 "start_time": time.time(),
+                "start_time_mono": time.monotonic(),
                 "current_track": None,
                 "volume": 100,
+                "is_paused": False,
                 "participants": set(),  # Set of user_ids in the voice chat
             }
             logger.info(f"Already in voice chat {chat_id}")
@@ -137,6 +141,9 @@ class VoiceChat:
             
             # Update active call info
             self.active_calls[chat_id]["current_track"] = track_info
+            self.active_calls[chat_id]["is_paused"] = False
+            # Per-track monotonic start so UI progress survives clock jumps
+            self.active_calls[chat_id]["start_time_mono"] = time.monotonic()
             
             # Update voice overlay with the new track if available
             await self.update_voice_overlay(chat_id, track_info)
@@ -154,6 +161,7 @@ class VoiceChat:
         
         try:
             await self.call_client.pause_stream(chat_id)
+            self.active_calls[chat_id]["is_paused"] = True
             logger.info(f"Paused track in {chat_id}")
             return True, "Playback paused"
         except NotInCallError:
@@ -170,6 +178,7 @@ class VoiceChat:
         
         try:
             await self.call_client.resume_stream(chat_id)
+            self.active_calls[chat_id]["is_paused"] = False
             logger.info(f"Resumed track in {chat_id}")
             return True, "Playback resumed"
         except NotInCallError: